@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Asyncio-native analysis API.
+
+CPU-bound analysis runs on a shared pool from claim_checker.workers, so the
+event loop stays responsive while texts are being analyzed.
+"""
+
+import asyncio
+import json
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    Union,
+)
+from weakref import WeakKeyDictionary
+
+from claim_checker.config import ConfigLike, Settings, resolve_settings
+from claim_checker.workers import AnalysisPool, get_pool
+
+Texts = Union[Iterable[str], AsyncIterable[str]]
+
+
+class AsyncAnalyzer:
+    """
+    Runs analyses on a worker pool with a bounded number in flight.
+    """
+
+    def __init__(
+        self,
+        config: ConfigLike,
+        max_concurrency: Optional[int] = None,
+        pool: Optional[AnalysisPool] = None,
+        hot_reload: bool = False,
+    ) -> None:
+        """
+        Initializes the async analyzer.
+
+        Args:
+            config: System configuration; a dictionary is validated here, so
+                pass a Settings snapshot when creating analyzers on the loop
+            max_concurrency: Maximum number of texts being analyzed at once,
+                defaults to the number of pool workers
+            pool: Pool to dispatch to, defaults to the shared pool for this
+                configuration
+            hot_reload: Whether the default pool picks up dictionary edits
+                while running
+        """
+        self.config = config
+        self.settings = resolve_settings(config)
+        self.hot_reload = hot_reload
+        self._pool = pool
+        self.max_concurrency = max_concurrency or self.pool.max_workers
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    @property
+    def pool(self) -> AnalysisPool:
+        """
+        Pool analyses are dispatched to.
+
+        Without an explicit pool the shared one is looked up on every use, so
+        the analyzer keeps working after shutdown_pools replaced it.
+        """
+        if self._pool is not None:
+            return self._pool
+        return get_pool(self.settings, hot_reload=self.hot_reload)
+
+    async def analyze_text(
+        self, text: str, language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyzes a text without blocking the event loop.
+
+        Waits while max_concurrency analyses are already in flight. Cancelling
+        the caller drops a queued analysis; one already running in a worker
+        finishes there and its result is discarded.
+
+        Args:
+            text: Text to analyze
+            language: Language code, defaults to the configured language
+
+        Returns:
+            Dictionary with analysis results
+        """
+        language = language or self.settings.default_language
+        async with self._semaphore:
+            return await asyncio.wrap_future(self.pool.submit(text, language))
+
+    async def analyze_texts(
+        self, texts: Texts, language: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Analyzes a stream of texts, yielding reports in input order.
+
+        At most max_concurrency texts are taken from the source ahead of the
+        consumer, so a slow consumer slows down reading of the source. Closing
+        the iterator cancels the analyses still in flight.
+
+        Args:
+            texts: Texts to analyze, as a regular or async iterable
+            language: Language code, defaults to the configured language
+
+        Yields:
+            Dictionary with analysis results for each text
+        """
+        pending: Deque["asyncio.Task[Dict[str, Any]]"] = deque()
+        try:
+            async for text in _aiter(texts):
+                if len(pending) >= self.max_concurrency:
+                    yield await pending.popleft()
+                pending.append(asyncio.ensure_future(self.analyze_text(text, language)))
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _aiter(texts: Texts) -> AsyncIterator[str]:
+    """Iterates over a regular or async iterable of texts."""
+    if isinstance(texts, AsyncIterable):
+        async for text in texts:
+            yield text
+    else:
+        for text in texts:
+            yield text
+
+
+# Default analyzers per event loop, keyed by configuration, limit and hot
+# reloading. An analyzer is stored under its settings fingerprint, so equal
+# configurations share one limit, and also under the canonical JSON of each
+# dictionary it was requested with, so repeated calls skip validation.
+_LoopAnalyzers = Dict[Tuple[str, Optional[int], bool], AsyncAnalyzer]
+_default_analyzers: "WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopAnalyzers]" = (
+    WeakKeyDictionary()
+)
+
+
+def _config_key(config: ConfigLike) -> str:
+    """Identifies a configuration without reading files or validating it."""
+    if isinstance(config, Settings):
+        return config.fingerprint
+    return json.dumps(config, sort_keys=True, default=str)
+
+
+async def _default_analyzer(
+    config: ConfigLike, max_concurrency: Optional[int], hot_reload: bool
+) -> AsyncAnalyzer:
+    """Returns the analyzer shared by module-level calls on the running loop."""
+    loop = asyncio.get_running_loop()
+    analyzers = _default_analyzers.setdefault(loop, {})
+    key = (_config_key(config), max_concurrency, hot_reload)
+    analyzer = analyzers.get(key)
+    if analyzer is None:
+        if isinstance(config, Settings):
+            settings = config
+        else:
+            # Reading the rule files and validating would block the loop
+            settings = await asyncio.to_thread(resolve_settings, config)
+        settings_key = (settings.fingerprint, max_concurrency, hot_reload)
+        analyzer = analyzers.get(settings_key)
+        if analyzer is None:
+            analyzer = AsyncAnalyzer(settings, max_concurrency, hot_reload=hot_reload)
+            analyzers[settings_key] = analyzer
+        analyzers[key] = analyzer
+    return analyzer
+
+
+async def analyze_text_async(
+    text: str,
+    language: str,
+    config: ConfigLike,
+    max_concurrency: Optional[int] = None,
+    hot_reload: bool = False,
+) -> Dict[str, Any]:
+    """
+    Analyzes text for logical fallacies and bias without blocking the loop.
+
+    Args:
+        text: Text to analyze
+        language: Language code
+        config: System configuration
+        max_concurrency: Limit shared by all calls with the same configuration
+        hot_reload: Whether the shared pool picks up dictionary edits
+
+    Returns:
+        Dictionary with analysis results
+    """
+    analyzer = await _default_analyzer(config, max_concurrency, hot_reload)
+    return await analyzer.analyze_text(text, language)
+
+
+async def analyze_texts_async(
+    texts: Texts,
+    language: str,
+    config: ConfigLike,
+    max_concurrency: Optional[int] = None,
+    hot_reload: bool = False,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Analyzes a batch of texts, yielding reports in input order.
+
+    Args:
+        texts: Texts to analyze, as a regular or async iterable
+        language: Language code
+        config: System configuration
+        max_concurrency: Limit shared by all calls with the same configuration
+        hot_reload: Whether the shared pool picks up dictionary edits
+
+    Yields:
+        Dictionary with analysis results for each text
+    """
+    analyzer = await _default_analyzer(config, max_concurrency, hot_reload)
+    async for report in analyzer.analyze_texts(texts, language):
+        yield report
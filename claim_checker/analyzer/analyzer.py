@@ -5,13 +5,15 @@ Text analyzer module.
 
 from typing import Any, Dict, List
 
+from claim_checker.config import ConfigLike
+
 
 class Analyzer:
     """
     Class for analyzing linguistic characteristics of text.
     """
 
-    def __init__(self, language: str, config: Dict[str, Any]) -> None:
+    def __init__(self, language: str, config: ConfigLike) -> None:
         """
         Initializes the analyzer for a specific language.
 
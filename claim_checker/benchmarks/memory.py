@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Memory-footprint benchmark for the analysis pipeline.
+
+Measures peak and retained allocations of every pipeline stage with
+tracemalloc, across input sizes and dictionary sizes, and checks them
+against the budgets in config/benchmarks/memory.yaml.
+
+Run with::
+
+    python -m claim_checker.benchmarks.memory [--budgets PATH] [--json PATH]
+
+The process exits with status 1 if any budget is exceeded.
+"""
+
+import argparse
+import gc
+import json
+import linecache
+import re
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import yaml
+
+from claim_checker.analyzer.analyzer import Analyzer
+from claim_checker.config import ConfigLike, get_config_dir, load_settings
+from claim_checker.detector.detector import EnhancedDetector
+from claim_checker.languages import get_language_pack
+from claim_checker.languages.resources import CompiledResources
+from claim_checker.logic_gates.pipeline import LogicPipeline
+from claim_checker.reporter.reporter import Reporter
+
+# Text the benchmark inputs are built from
+SAMPLE_PATH = (
+    Path(__file__).parent.parent.parent / "data" / "test_corpus" / "sample.txt"
+)
+
+DEFAULT_SAMPLE = (
+    "Всі люди або люблять шоколад, або ненавидять його. "
+    "Опонент не розуміє основ економіки, тому його аргументи безглузді. "
+    "Можливо, ця ідея має певні переваги, але здається, що вона радикальна.\n"
+)
+
+
+def get_budgets_path() -> Path:
+    """Returns the path to the default memory budgets file."""
+    return get_config_dir() / "benchmarks" / "memory.yaml"
+
+
+def load_budgets(path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Loads the benchmark matrix and memory budgets.
+
+    Args:
+        path: Budgets file, defaults to config/benchmarks/memory.yaml
+
+    Returns:
+        Dictionary with input_sizes, dictionary_scales, top_sites and budgets
+    """
+    path = path or get_budgets_path()
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def make_text(size: int) -> str:
+    """
+    Builds an input text of roughly the given number of characters.
+
+    Args:
+        size: Number of characters
+
+    Returns:
+        Sample text repeated up to the requested size
+    """
+    sample = SAMPLE_PATH.read_text("utf-8") if SAMPLE_PATH.exists() else ""
+    sample = sample or DEFAULT_SAMPLE
+    return (sample * (size // len(sample) + 1))[:size]
+
+
+def scale_resources(resources: Dict[str, Any], scale: int) -> Dict[str, Any]:
+    """
+    Grows a set of dictionaries with synthetic entries.
+
+    Args:
+        resources: Dictionaries as returned by a loader's load_all
+        scale: Target size as a multiple of the original dictionaries
+
+    Returns:
+        New dictionaries with (scale - 1) synthetic copies of every entry
+    """
+    scaled: Dict[str, Any] = {
+        "emotional_words": dict(resources.get("emotional_words", {})),
+        "intensifiers": dict(resources.get("intensifiers", {})),
+        "hedges": dict(resources.get("hedges", {})),
+        "logical_patterns": {
+            name: list(patterns)
+            for name, patterns in resources.get("logical_patterns", {}).items()
+        },
+    }
+    for copy in range(1, scale):
+        suffix = f"синт{copy}"
+        for key in ("emotional_words", "intensifiers", "hedges"):
+            for word, value in resources.get(key, {}).items():
+                scaled[key][f"{word}{suffix}"] = value
+        for name, patterns in resources.get("logical_patterns", {}).items():
+            scaled["logical_patterns"][name].extend(
+                f"{pattern} {suffix}" for pattern in patterns
+            )
+    return scaled
+
+
+def count_entries(resources: Dict[str, Any]) -> int:
+    """Returns the total number of dictionary entries and patterns."""
+    return sum(
+        len(patterns) for patterns in resources.get("logical_patterns", {}).values()
+    ) + sum(
+        len(resources.get(key, {}))
+        for key in ("emotional_words", "intensifiers", "hedges")
+    )
+
+
+def _measure(stage: Callable[[], Any], top_sites: int) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Runs one stage under tracemalloc.
+
+    Args:
+        stage: Callable running the stage
+        top_sites: Number of allocation sites to report
+
+    Returns:
+        Stage result and its memory measurements
+    """
+    gc.collect()
+    before_snapshot = tracemalloc.take_snapshot()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+
+    result = stage()
+
+    after, peak = tracemalloc.get_traced_memory()
+    after_snapshot = tracemalloc.take_snapshot()
+
+    # Leave out the bookkeeping of tracemalloc and of this benchmark
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ]
+    diff = after_snapshot.filter_traces(filters).compare_to(
+        before_snapshot.filter_traces(filters), "lineno"
+    )
+    sites = []
+    for stat in [stat for stat in diff if stat.size_diff > 0][:top_sites]:
+        frame = stat.traceback[0]
+        sites.append(
+            {
+                "site": f"{frame.filename}:{frame.lineno}",
+                "code": linecache.getline(frame.filename, frame.lineno).strip(),
+                "size_kib": round(stat.size_diff / 1024, 1),
+                "count": stat.count_diff,
+            }
+        )
+
+    return result, {
+        "peak_kib": round((peak - before) / 1024, 1),
+        "retained_kib": round((after - before) / 1024, 1),
+        "top_sites": sites,
+    }
+
+
+def run_case(
+    config: ConfigLike,
+    resources: Dict[str, Any],
+    text_size: int,
+    dictionary_scale: int,
+    top_sites: int = 5,
+) -> Dict[str, Any]:
+    """
+    Measures every pipeline stage for one input size and dictionary size.
+
+    Args:
+        config: System configuration
+        resources: Base dictionaries of the language
+        text_size: Number of characters of input text
+        dictionary_scale: Dictionary size as a multiple of the base dictionaries
+        top_sites: Number of allocation sites to report per stage
+
+    Returns:
+        Case parameters and per-stage measurements
+    """
+    text = make_text(text_size)
+    scaled = scale_resources(resources, dictionary_scale)
+
+    stages: Dict[str, Dict[str, Any]] = {}
+    # Drop patterns compiled by earlier cases, so "load" measures real compile cost
+    re.purge()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        compiled, stages["load"] = _measure(
+            lambda: CompiledResources(scaled, f"x{dictionary_scale}"), top_sites
+        )
+        analyzer = Analyzer("uk", config)
+        detector = EnhancedDetector("uk", config, resources=compiled)
+        pipeline = LogicPipeline(config)
+        reporter = Reporter("uk", config)
+
+        analysis, stages["analyze"] = _measure(
+            lambda: analyzer.analyze(text), top_sites
+        )
+        detection, stages["detect"] = _measure(
+            lambda: detector.detect(text, analysis), top_sites
+        )
+        processed, stages["logic_gates"] = _measure(
+            lambda: pipeline.process(detection), top_sites
+        )
+        _, stages["report"] = _measure(
+            lambda: reporter.generate_report(processed), top_sites
+        )
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "text_size": text_size,
+        "dictionary_scale": dictionary_scale,
+        "dictionary_entries": count_entries(scaled),
+        "stages": stages,
+    }
+
+
+def stage_limit(
+    budget: Dict[str, Any], metric: str, text_size: int, entries: int
+) -> Optional[float]:
+    """
+    Computes the limit of a metric for one case.
+
+    A budget entry such as ``peak_kib: {base: 64, per_kchar: 8, per_kentry: 16}``
+    allows base + per_kchar * (chars / 1000) + per_kentry * (entries / 1000) KiB.
+
+    Args:
+        budget: Budgets of one stage
+        metric: "peak_kib" or "retained_kib"
+        text_size: Number of characters of input text
+        entries: Number of dictionary entries
+
+    Returns:
+        Limit in KiB, or None if the metric has no budget
+    """
+    spec = budget.get(metric)
+    if spec is None:
+        return None
+    if not isinstance(spec, dict):
+        return float(spec)
+    return (
+        float(spec.get("base", 0))
+        + float(spec.get("per_kchar", 0)) * text_size / 1000
+        + float(spec.get("per_kentry", 0)) * entries / 1000
+    )
+
+
+def check_budgets(
+    cases: Sequence[Dict[str, Any]], budgets: Dict[str, Any]
+) -> List[str]:
+    """
+    Compares measurements with the budgets.
+
+    Args:
+        cases: Results of run_case
+        budgets: Budgets per stage
+
+    Returns:
+        Human-readable descriptions of every exceeded budget
+    """
+    violations = []
+    for case in cases:
+        for stage, measured in case["stages"].items():
+            for metric in ("peak_kib", "retained_kib"):
+                limit = stage_limit(
+                    budgets.get(stage, {}),
+                    metric,
+                    case["text_size"],
+                    case["dictionary_entries"],
+                )
+                if limit is not None and measured[metric] > limit:
+                    violations.append(
+                        f"{stage} {metric} {measured[metric]:.1f} > {limit:.1f} KiB "
+                        f"(text_size={case['text_size']}, "
+                        f"dictionary_scale={case['dictionary_scale']})"
+                    )
+    return violations
+
+
+def run_benchmark(
+    config: Optional[ConfigLike] = None, budgets: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Runs the full benchmark matrix.
+
+    Args:
+        config: System configuration, defaults to load_settings()
+        budgets: Benchmark matrix and budgets, defaults to load_budgets()
+
+    Returns:
+        Dictionary with the measured cases and budget violations
+    """
+    config = config if config is not None else load_settings()
+    budgets = budgets if budgets is not None else load_budgets()
+
+    pack = get_language_pack("uk")
+    if pack is None:
+        raise RuntimeError("The Ukrainian language pack is not available")
+    resources = pack.create_loader().load_all()
+
+    cases = [
+        run_case(config, resources, size, scale, int(budgets.get("top_sites", 5)))
+        for scale in budgets.get("dictionary_scales", [1])
+        for size in budgets.get("input_sizes", [1000])
+    ]
+    return {
+        "cases": cases,
+        "violations": check_budgets(cases, budgets.get("budgets", {})),
+    }
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    """
+    Formats benchmark results as a text table.
+
+    Args:
+        results: Output of run_benchmark
+
+    Returns:
+        Table of measurements followed by top allocation sites
+    """
+    lines = [
+        f"{'chars':>8} {'dict':>6} {'stage':<12} {'peak KiB':>10} {'retained KiB':>13}"
+    ]
+    for case in results["cases"]:
+        for stage, measured in case["stages"].items():
+            lines.append(
+                f"{case['text_size']:>8} {case['dictionary_entries']:>6} "
+                f"{stage:<12} {measured['peak_kib']:>10.1f} "
+                f"{measured['retained_kib']:>13.1f}"
+            )
+
+    largest = max(
+        results["cases"], key=lambda c: (c["text_size"], c["dictionary_scale"])
+    )
+    lines.append("")
+    lines.append(
+        f"Top allocation sites (text_size={largest['text_size']}, "
+        f"dictionary_scale={largest['dictionary_scale']}):"
+    )
+    for stage, measured in largest["stages"].items():
+        for site in measured["top_sites"]:
+            lines.append(
+                f"  {stage:<12} {site['size_kib']:>9.1f} KiB  {site['site']}  "
+                f"{site['code']}"
+            )
+
+    lines.append("")
+    if results["violations"]:
+        lines.append("Budget violations:")
+        lines.extend(f"  {violation}" for violation in results["violations"])
+    else:
+        lines.append("All memory budgets met.")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Runs the benchmark from the command line.
+
+    Args:
+        argv: Command-line arguments
+
+    Returns:
+        Exit status, 1 if any budget was exceeded
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budgets", type=Path, help="Budgets file")
+    parser.add_argument("--json", type=Path, help="Write raw results to this file")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(budgets=load_budgets(args.budgets))
+    print(format_results(results))
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2, ensure_ascii=False), "utf-8")
+    return 1 if results["violations"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
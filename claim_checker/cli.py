@@ -8,9 +8,6 @@ from typing import Optional
 
 import typer
 
-from claim_checker.config import load_config
-from claim_checker.core import analyze_file, analyze_text
-
 # Create the main app
 app = typer.Typer(help="Tool for analyzing text for logical fallacies and bias")
 
@@ -27,9 +24,21 @@ def analyze(
         "uk", "--language", "-l", help="Analysis language (default: uk)"
     ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+    charts: Optional[Path] = typer.Option(
+        None, "--charts", help="Directory to render report charts into"
+    ),
 ) -> None:
     """Analyzes text or file for logical fallacies, bias, and unsupported claims."""
-    config = load_config()
+    # Imported here so that --help does not pay for the analysis stack
+    from claim_checker.config import load_settings
+    from claim_checker.core import analyze_file, analyze_text
+
+    # Validate the configuration before any analysis work starts
+    try:
+        config = load_settings()
+    except (FileNotFoundError, ValueError) as e:
+        typer.echo(f"Configuration error: {e}", err=True)
+        raise typer.Exit(1) from e
 
     if text:
         result = analyze_text(text, language, config)
@@ -59,6 +68,119 @@ def analyze(
         else:
             typer.echo("- No recommendations at this time.")
 
+    if charts:
+        from claim_checker.reporter.reporter import Reporter
+
+        images = Reporter(language, config).render_visualizations(result)
+        charts.mkdir(parents=True, exist_ok=True)
+        for kind, image in images.items():
+            (charts / f"{kind}.png").write_bytes(image)
+        typer.echo(f"Charts saved to {charts}")
+
+
+@app.command("train-classifier")
+def train_classifier(
+    data: Path = typer.Argument(
+        ..., help="Labeled file with '<0|1><TAB><sentence>' lines"
+    ),
+    output: Path = typer.Option(
+        Path("models/claims.joblib"), "--output", "-o", help="Path to save the model"
+    ),
+    c: float = typer.Option(1.0, "--c", help="Inverse regularization strength"),
+) -> None:
+    """Trains the unsupported-claim classifier on a local labeled file."""
+    # Imported here so that scikit-learn is only loaded for training
+    from claim_checker.detector.classifier import train_classifier as train
+
+    try:
+        stats = train(data, output, c)
+    except (FileNotFoundError, ValueError) as e:
+        typer.echo(f"Training error: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    typer.echo(
+        f"Trained on {stats['sentences']} sentences ({stats['positives']} claims), "
+        f"training accuracy {stats['training_accuracy']:.2%}."
+    )
+    typer.echo(f"Model saved to {output}")
+    typer.echo("Set detector.claim_model in config.yaml to use it.")
+
+
+@app.command("plan")
+def plan_command(
+    corpus: Path = typer.Argument(..., help="Corpus file or directory"),
+    run_dir: Path = typer.Argument(..., help="Directory for the manifest and shards"),
+    shard_size: int = typer.Option(
+        10000, "--shard-size", "-s", help="Maximum documents per shard"
+    ),
+    language: str = typer.Option(
+        "uk", "--language", "-l", help="Analysis language (default: uk)"
+    ),
+) -> None:
+    """Splits a corpus into shards and writes the run manifest."""
+    from claim_checker.config import load_settings
+    from claim_checker.sharding import ShardError, plan
+
+    try:
+        manifest = plan(corpus, run_dir, shard_size, load_settings(), language)
+    except (FileNotFoundError, ValueError, ShardError) as e:
+        typer.echo(f"Planning error: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    typer.echo(
+        f"Planned {manifest['documents']} documents in "
+        f"{len(manifest['shards'])} shards."
+    )
+    for shard in manifest["shards"]:
+        typer.echo(shard["id"])
+
+
+@app.command("run-shard")
+def run_shard_command(
+    run_dir: Path = typer.Argument(..., help="Run directory created by plan"),
+    shard_id: str = typer.Argument(..., help="Shard to process"),
+    force: bool = typer.Option(
+        False, "--force", help="Process the shard even if it is complete"
+    ),
+) -> None:
+    """Analyzes one shard into its own reports and summary."""
+    from claim_checker.config import load_settings
+    from claim_checker.sharding import ShardError, run_shard
+
+    try:
+        summary = run_shard(run_dir, shard_id, load_settings(), force)
+    except (FileNotFoundError, ValueError, ShardError) as e:
+        typer.echo(f"Shard error: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    if summary is None:
+        typer.echo(f"{shard_id} is already complete.")
+    else:
+        typer.echo(f"{shard_id} completed: {summary['documents']} documents.")
+
+
+@app.command("merge")
+def merge_command(
+    run_dir: Path = typer.Argument(..., help="Run directory created by plan"),
+    no_verify: bool = typer.Option(
+        False, "--no-verify", help="Skip checking shard reports against summaries"
+    ),
+) -> None:
+    """Combines the outputs of all shards into one report."""
+    from claim_checker.sharding import ShardError, merge
+
+    try:
+        report = merge(run_dir, verify=not no_verify)
+    except (FileNotFoundError, ValueError, ShardError) as e:
+        typer.echo(f"Merge error: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    overall = report["overall"]
+    typer.echo(
+        f"Merged {report['shards']} shards: {overall['documents']} documents, "
+        f"mean score {overall['mean_score']}."
+    )
+
 
 # Create a default command that mimics analyze to maintain backwards compatibility
 @app.callback(invoke_without_command=True)
@@ -76,7 +198,14 @@ def main(
 ) -> None:
     """Main entry point that forwards to analyze command when no subcommand is specified."""
     if ctx.invoked_subcommand is None and (text or file):
-        analyze(text=text, file=file, output=output, language=language, verbose=verbose)
+        analyze(
+            text=text,
+            file=file,
+            output=output,
+            language=language,
+            verbose=verbose,
+            charts=None,
+        )
 
 
 if __name__ == "__main__":
@@ -3,11 +3,29 @@
 Module for working with claim_checker configuration.
 """
 
+import functools
+import hashlib
+import json
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Literal, Mapping, Optional, Tuple, Union
 
 import yaml
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    FilePath,
+    PrivateAttr,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
+
+Severity = Literal["low", "medium", "high"]
 
 
 def get_config_dir() -> Path:
@@ -21,24 +39,309 @@ def get_config_dir() -> Path:
     return Path(__file__).parent.parent / "config"
 
 
+def _read_yaml(path: Path) -> Dict[str, Any]:
+    """Reads a YAML file, treating an empty file as an empty mapping."""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}  # Ensure we don't get None
+
+
 def load_config() -> Dict[str, Any]:
     """Loads the main configuration and language resources."""
-    config_dir = get_config_dir()
+    return load_config_from(get_config_dir())
+
+
+def load_config_from(config_dir: Path) -> Dict[str, Any]:
+    """
+    Loads the main configuration and language resources from a directory.
+
+    Args:
+        config_dir: Configuration directory
+
+    Returns:
+        Configuration dictionary
+    """
     config_path = config_dir / "config.yaml"
 
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f) or {}  # Ensure we don't get None
+    config = _read_yaml(config_path)
 
     # Load language resources
     default_language = config.get("default_language", "uk")
     language_config_path = config_dir / "languages" / default_language / "config.yaml"
 
     if language_config_path.exists():
-        with open(language_config_path, "r", encoding="utf-8") as f:
-            language_config = yaml.safe_load(f) or {}
-            config["language"] = language_config.get("language", {})
+        language_config = _read_yaml(language_config_path)
+        config["language"] = language_config.get("language", {})
+
+    return config
+
+
+class _Frozen(BaseModel):
+    """Base class for immutable configuration sections."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class ModuleSettings(_Frozen):
+    """Settings of a single pipeline module."""
+
+    enabled: bool = True
+
+
+class ModulesSettings(_Frozen):
+    """Settings of all pipeline modules."""
+
+    analyzer: ModuleSettings = ModuleSettings()
+    detector: ModuleSettings = ModuleSettings()
+    reporter: ModuleSettings = ModuleSettings()
+    logic_gates: ModuleSettings = ModuleSettings()
+
+
+class LoggingSettings(_Frozen):
+    """Logging settings."""
+
+    level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
+    file: Optional[str] = None
+
+
+class LanguageResourcesSettings(_Frozen):
+    """Resources required by a language."""
+
+    dictionaries: Tuple[str, ...] = ()
+    models: Tuple[str, ...] = ()
+
+
+class LanguageSettings(_Frozen):
+    """Settings of the default language."""
+
+    code: str
+    name: str = ""
+    resources: LanguageResourcesSettings = LanguageResourcesSettings()
+
+
+class DetectorSettings(_Frozen):
+    """Thresholds and models used by the detector."""
+
+    emotion_threshold: int = Field(default=7, ge=1, le=10)
+    hedge_threshold: int = Field(default=6, ge=1, le=10)
+    default_severity: Severity = "medium"
+    # Optional model scoring unsupported claims; see claim_checker.detector.classifier.
+    # Relative paths are resolved against the configuration directory
+    claim_model: Optional[FilePath] = None
+    claim_threshold: float = Field(default=0.5, ge=0, le=1)
+
+
+class RuleSettings(_Frozen):
+    """
+    A logical fallacy rule.
+
+    Patterns are language-specific and come from the language packs.
+    """
+
+    name: str
+    description: str = ""
+    severity: Severity = "medium"
+
+
+class Settings(_Frozen):
+    """
+    Validated, immutable configuration snapshot.
+
+    Merges the main configuration, the default language configuration and the
+    rule files, and precomputes the lookups the detectors need.
+    """
+
+    version: str = "0.0.0"
+    default_language: str = "uk"
+    modules: ModulesSettings = ModulesSettings()
+    logging: LoggingSettings = LoggingSettings()
+    language: Optional[LanguageSettings] = None
+    detector: DetectorSettings = DetectorSettings()
+    rules: Tuple[RuleSettings, ...] = ()
+
+    _severity_map: Mapping[str, str] = PrivateAttr(
+        default_factory=lambda: MappingProxyType({})
+    )
+    _fingerprint: str = PrivateAttr("")
 
+    @field_validator("rules", mode="before")
+    @classmethod
+    def _rules_from_mapping(cls, value: Any) -> Any:
+        """Accepts rules as a mapping of rule name to rule settings."""
+        if isinstance(value, Mapping):
+            return tuple({"name": name, **(rule or {})} for name, rule in value.items())
+        return value
+
+    @model_validator(mode="after")
+    def _precompute(self) -> "Settings":
+        """Builds derived lookups once, when the snapshot is created."""
+        names = [rule.name for rule in self.rules]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate rules: {', '.join(duplicates)}")
+
+        self._severity_map = MappingProxyType(
+            {rule.name: rule.severity for rule in self.rules}
+        )
+        canonical = json.dumps(
+            self.model_dump(mode="json"), sort_keys=True, ensure_ascii=False
+        )
+        self._fingerprint = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return self
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Dict[str, Any]]]:
+        """Pickles as plain data; derived lookups are rebuilt on unpickling."""
+        return (type(self).model_validate, (self.model_dump(),))
+
+    @property
+    def severity_map(self) -> Mapping[str, str]:
+        """Read-only mapping of fallacy type to severity."""
+        return self._severity_map
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable hash of the settings, suitable as a cache key."""
+        return self._fingerprint
+
+    def severity(self, fallacy_type: str) -> str:
+        """
+        Get the severity level for a fallacy type.
+
+        Args:
+            fallacy_type: Type of fallacy
+
+        Returns:
+            Severity level (low, medium, high)
+        """
+        return self._severity_map.get(fallacy_type, self.detector.default_severity)
+
+
+ConfigLike = Union[Settings, Dict[str, Any]]
+
+# Settings validated from dictionaries, keyed by canonical JSON and the
+# configuration directory supplying default rules
+DICT_CACHE_SIZE = 64
+_dict_settings: "OrderedDict[Tuple[str, Path], Settings]" = OrderedDict()
+_dict_settings_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _default_rules(config_dir: Path) -> Mapping[str, Any]:
+    """Returns the rules of a configuration directory, reading them once."""
+    return MappingProxyType(_load_rules(config_dir))
+
+
+def _load_rules(config_dir: Path) -> Dict[str, Any]:
+    """
+    Merges the rule files of a configuration directory.
+
+    Args:
+        config_dir: Configuration directory
+
+    Returns:
+        Dictionary mapping rule name to rule settings
+    """
+    rules: Dict[str, Any] = {}
+    rules_dir = config_dir / "rules"
+    if rules_dir.is_dir():
+        for rules_path in sorted(rules_dir.glob("*.yaml")):
+            for name, rule in _read_yaml(rules_path).get("rules", {}).items():
+                if name in rules:
+                    raise ValueError(f"Rule {name!r} redefined in {rules_path}")
+                rules[name] = rule
+    return rules
+
+
+def _validate(config: Dict[str, Any], origin: str) -> Settings:
+    """Validates a configuration dictionary, reporting errors as ValueError."""
+    try:
+        return Settings.model_validate(config)
+    except ValidationError as e:
+        raise ValueError(f"Invalid configuration in {origin}:\n{e}") from e
+
+
+def resolve_settings(config: ConfigLike) -> Settings:
+    """
+    Returns settings for either a snapshot or a plain configuration dictionary.
+
+    Dictionaries without rules, such as the result of load_config, get the
+    rules of the default configuration directory, and relative model paths
+    are resolved against that directory, as in load_settings. Validated dictionaries are
+    cached by content, so passing the same configuration again is cheap;
+    entry points still convert once and hand the snapshot to components.
+
+    Args:
+        config: Settings snapshot or configuration dictionary
+
+    Returns:
+        Validated settings
+
+    Raises:
+        ValueError: If the configuration is invalid
+    """
+    if isinstance(config, Settings):
+        return config
+
+    config_dir = get_config_dir().resolve()
+    try:
+        key = (json.dumps(config, sort_keys=True, default=str), config_dir)
+    except TypeError:
+        # Keys that cannot be sorted; validate without caching
+        return _settings_from_dict(config, config_dir)
+
+    with _dict_settings_lock:
+        settings = _dict_settings.get(key)
+        if settings is not None:
+            _dict_settings.move_to_end(key)
+            return settings
+
+    settings = _settings_from_dict(config, config_dir)
+    with _dict_settings_lock:
+        _dict_settings[key] = settings
+        while len(_dict_settings) > DICT_CACHE_SIZE:
+            _dict_settings.popitem(last=False)
+    return settings
+
+
+def _with_model_paths(config: Dict[str, Any], config_dir: Path) -> Dict[str, Any]:
+    """Resolves relative model paths against the configuration directory."""
+    detector = config.get("detector")
+    if isinstance(detector, dict) and detector.get("claim_model"):
+        claim_model = config_dir / detector["claim_model"]
+        config = {**config, "detector": {**detector, "claim_model": claim_model}}
     return config
+
+
+def _settings_from_dict(config: Dict[str, Any], config_dir: Path) -> Settings:
+    """Validates a configuration dictionary, adding the default rules."""
+    if "rules" not in config:
+        config = {**config, "rules": _default_rules(config_dir)}
+    config = _with_model_paths(config, config_dir)
+    return _validate(config, "configuration dictionary")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_settings(config_dir: Path) -> Settings:
+    """Loads and validates the settings stored in a configuration directory."""
+    config = load_config_from(config_dir)
+    config["rules"] = _load_rules(config_dir)
+    return _validate(_with_model_paths(config, config_dir), str(config_dir))
+
+
+def load_settings(config_dir: Optional[Path] = None) -> Settings:
+    """
+    Loads the settings snapshot, reading the files only once per process.
+
+    Args:
+        config_dir: Configuration directory, defaults to get_config_dir()
+
+    Returns:
+        Validated, immutable settings
+
+    Raises:
+        FileNotFoundError: If the main configuration file is missing
+        ValueError: If the configuration is invalid
+    """
+    return _load_settings((config_dir or get_config_dir()).resolve())
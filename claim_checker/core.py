@@ -4,15 +4,90 @@ Core module for claim_checker that coordinates the analysis process.
 """
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Sequence
 
 from claim_checker.analyzer.analyzer import Analyzer
+from claim_checker.config import ConfigLike, resolve_settings
 from claim_checker.detector.detector import EnhancedDetector
+from claim_checker.languages.resources import ResourceWatcher
 from claim_checker.logic_gates.pipeline import LogicPipeline
 from claim_checker.reporter.reporter import Reporter
 
 
-def analyze_text(text: str, language: str, config: Dict[str, Any]) -> Dict[str, Any]:
+class AnalysisComponents:
+    """
+    Set of analysis components for one language, reusable across texts.
+    """
+
+    def __init__(
+        self,
+        language: str,
+        config: ConfigLike,
+        watcher: Optional[ResourceWatcher] = None,
+    ) -> None:
+        """
+        Initializes the main components.
+
+        Args:
+            language: Language code
+            config: System configuration
+            watcher: Source of hot-reloaded language resources
+        """
+        # Validate a configuration dictionary once for all components
+        settings = resolve_settings(config)
+        self.language = language
+        self.analyzer = Analyzer(language, settings)
+        self.detector = EnhancedDetector(language, settings, watcher)
+        self.reporter = Reporter(language, settings)
+        self.pipeline = LogicPipeline(settings)
+
+    def analyze(self, text: str) -> Dict[str, Any]:
+        """
+        Runs the full analysis pipeline on a text.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Dictionary with analysis results
+        """
+        # Analyze text
+        analysis_result = self.analyzer.analyze(text)
+        detection_result = self.detector.detect(text, analysis_result)
+
+        # Apply logic rules
+        processed_result = self.pipeline.process(detection_result)
+
+        # Generate report
+        return self.reporter.generate_report(processed_result)
+
+    def analyze_batch(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Runs the full analysis pipeline on several texts.
+
+        Detection runs once for the whole batch, so a configured claim model
+        scores all sentences in a single call.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            Dictionary with analysis results for each text
+        """
+        analysis_results = [self.analyzer.analyze(text) for text in texts]
+        detection_results = self.detector.detect_batch(texts, analysis_results)
+        return [
+            self.reporter.generate_report(self.pipeline.process(detection_result))
+            for detection_result in detection_results
+        ]
+
+
+def analyze_text(
+    text: str,
+    language: str,
+    config: ConfigLike,
+    watcher: Optional[ResourceWatcher] = None,
+) -> Dict[str, Any]:
     """
     Analyzes text for logical fallacies and bias.
 
@@ -20,31 +95,19 @@ def analyze_text(text: str, language: str, config: Dict[str, Any]) -> Dict[str,
         text: Text to analyze
         language: Language code
         config: System configuration
+        watcher: Source of hot-reloaded language resources
 
     Returns:
         Dictionary with analysis results
     """
-    # Initialize main components
-    analyzer = Analyzer(language, config)
-    detector = EnhancedDetector(language, config)
-    reporter = Reporter(language, config)
-    pipeline = LogicPipeline(config)
-
-    # Analyze text
-    analysis_result = analyzer.analyze(text)
-    detection_result = detector.detect(text, analysis_result)
-
-    # Apply logic rules
-    processed_result = pipeline.process(detection_result)
-
-    # Generate report
-    report = reporter.generate_report(processed_result)
-
-    return report
+    return AnalysisComponents(language, config, watcher).analyze(text)
 
 
 def analyze_file(
-    file_path: Path, language: str, config: Dict[str, Any]
+    file_path: Path,
+    language: str,
+    config: ConfigLike,
+    watcher: Optional[ResourceWatcher] = None,
 ) -> Dict[str, Any]:
     """
     Analyzes a file for logical fallacies and bias.
@@ -53,6 +116,7 @@ def analyze_file(
         file_path: Path to the file
         language: Language code
         config: System configuration
+        watcher: Source of hot-reloaded language resources
 
     Returns:
         Dictionary with analysis results
@@ -60,4 +124,4 @@ def analyze_file(
     with open(file_path, "r", encoding="utf-8") as f:
         text = f.read()
 
-    return analyze_text(text, language, config)
+    return analyze_text(text, language, config, watcher)
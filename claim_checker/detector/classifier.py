@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Sparse-vector classifier for unsupported claims.
+
+Sentences are hashed into sparse feature vectors with a HashingVectorizer,
+so no vocabulary is fitted or kept in memory, and scored by a linear model
+in a single vectorized call per batch. scikit-learn is only imported when a
+model is trained or loaded.
+"""
+
+import functools
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Version of the saved model artifact layout
+ARTIFACT_FORMAT = 1
+
+# Parameters of the stateless feature hashing
+DEFAULT_VECTORIZER_PARAMS: Dict[str, Any] = {
+    "n_features": 2**18,
+    "ngram_range": (1, 2),
+    "alternate_sign": False,
+    "lowercase": True,
+    "norm": "l2",
+}
+
+
+def read_labeled_file(path: Path) -> Tuple[List[str], List[int]]:
+    """
+    Reads a labeled sentence file.
+
+    Each non-empty line that does not start with "#" holds a label (1 for an
+    unsupported claim, 0 otherwise), a tab and the sentence.
+
+    Args:
+        path: Path to the labeled file
+
+    Returns:
+        Tuple of sentences and labels
+    """
+    sentences: List[str] = []
+    labels: List[int] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            parts = line.split("\t", 1)
+            if len(parts) != 2 or parts[0] not in ("0", "1"):
+                raise ValueError(f"{path}:{line_number}: expected '<0|1>\\t<sentence>'")
+            labels.append(int(parts[0]))
+            sentences.append(parts[1])
+
+    return sentences, labels
+
+
+class ClaimClassifier:
+    """
+    Linear classifier scoring how likely sentences are unsupported claims.
+    """
+
+    def __init__(self, model: Any, vectorizer_params: Dict[str, Any]) -> None:
+        """
+        Initializes the classifier from a fitted linear model.
+
+        Args:
+            model: Fitted scikit-learn linear model with predict_proba
+            vectorizer_params: HashingVectorizer parameters used for training
+        """
+        from sklearn.feature_extraction.text import HashingVectorizer
+
+        self.model = model
+        self.vectorizer_params = dict(vectorizer_params)
+        self.vectorizer = HashingVectorizer(**self.vectorizer_params)
+
+    def score(self, sentences: Sequence[str]) -> "np.ndarray":
+        """
+        Scores sentences in one vectorized call.
+
+        Args:
+            sentences: Sentences to score
+
+        Returns:
+            Probability that each sentence is an unsupported claim
+        """
+        import numpy as np
+
+        if not sentences:
+            return np.zeros(0)
+        features = self.vectorizer.transform(sentences)
+        probabilities: np.ndarray = self.model.predict_proba(features)[:, 1]
+        return probabilities
+
+    @classmethod
+    def train(
+        cls, sentences: Sequence[str], labels: Sequence[int], c: float = 1.0
+    ) -> "ClaimClassifier":
+        """
+        Fits a classifier on labeled sentences.
+
+        Args:
+            sentences: Training sentences
+            labels: 1 for unsupported claims, 0 otherwise
+            c: Inverse regularization strength
+
+        Returns:
+            Fitted classifier
+        """
+        from sklearn.feature_extraction.text import HashingVectorizer
+        from sklearn.linear_model import LogisticRegression
+
+        if len(set(labels)) != 2:
+            raise ValueError("Training data must contain both labels 0 and 1")
+
+        vectorizer = HashingVectorizer(**DEFAULT_VECTORIZER_PARAMS)
+        model = LogisticRegression(C=c, solver="liblinear", random_state=0)
+        model.fit(vectorizer.transform(sentences), list(labels))
+        return cls(model, DEFAULT_VECTORIZER_PARAMS)
+
+    def save(self, path: Path) -> None:
+        """
+        Saves the model artifact.
+
+        Args:
+            path: Output path
+        """
+        import joblib
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(
+            {
+                "format": ARTIFACT_FORMAT,
+                "vectorizer_params": self.vectorizer_params,
+                "model": self.model,
+            },
+            path,
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "ClaimClassifier":
+        """
+        Loads a model artifact saved with save.
+
+        Args:
+            path: Artifact path
+
+        Returns:
+            Loaded classifier
+        """
+        import joblib
+
+        artifact = joblib.load(path)
+        if artifact.get("format") != ARTIFACT_FORMAT:
+            raise ValueError(f"Unsupported claim model format in {path}")
+        return cls(artifact["model"], artifact["vectorizer_params"])
+
+
+@functools.lru_cache(maxsize=None)
+def _load_cached(path: str, mtime_ns: int) -> ClaimClassifier:
+    """Loads a classifier once per path and modification time."""
+    return ClaimClassifier.load(Path(path))
+
+
+def load_classifier(path: Path) -> ClaimClassifier:
+    """
+    Loads a model artifact once per process.
+
+    Args:
+        path: Artifact path
+
+    Returns:
+        Classifier shared by all detectors using this artifact
+    """
+    resolved = Path(path).resolve()
+    return _load_cached(str(resolved), os.stat(resolved).st_mtime_ns)
+
+
+def train_classifier(
+    data_path: Path, output_path: Path, c: float = 1.0
+) -> Dict[str, Any]:
+    """
+    Trains a classifier on a labeled file and saves it.
+
+    Args:
+        data_path: Labeled sentence file
+        output_path: Where to save the model artifact
+        c: Inverse regularization strength
+
+    Returns:
+        Training statistics
+    """
+    import numpy as np
+
+    sentences, labels = read_labeled_file(data_path)
+    classifier = ClaimClassifier.train(sentences, labels, c)
+    classifier.save(output_path)
+
+    predictions = (classifier.score(sentences) >= 0.5).astype(int)
+    accuracy = float(np.mean(predictions == np.array(labels)))
+    return {
+        "sentences": len(sentences),
+        "positives": sum(labels),
+        "training_accuracy": round(accuracy, 4),
+    }
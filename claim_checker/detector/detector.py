@@ -1,40 +1,107 @@
 #!/usr/bin/env python3
 """
-Enhanced detector module that uses Ukrainian dictionaries.
+Enhanced detector module that uses language pack dictionaries.
 """
 
 import re
-from typing import Any, Dict, List
-
-from claim_checker.languages.uk.loader import UkrainianResourceLoader
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence
+
+from claim_checker.config import ConfigLike, resolve_settings
+from claim_checker.languages import get_language_pack
+from claim_checker.languages.resources import CompiledResources, ResourceWatcher
+
+if TYPE_CHECKING:
+    from claim_checker.detector.classifier import ClaimClassifier
+
+# Markers of absolute statements
+ABSOLUTE_INDICATORS = (
+    "всі",
+    "завжди",
+    "ніколи",
+    "кожен",
+    "жоден",
+    "повністю",
+    "абсолютно",
+    "безумовно",
+)
+
+# Markers of supporting evidence
+EVIDENCE_INDICATORS = (
+    "оскільки",
+    "тому що",
+    "через те що",
+    "за даними",
+    "дослідження показують",
+    "згідно з",
+    "як свідчить",
+)
 
 
 class EnhancedDetector:
     """
     Enhanced class for detecting logical fallacies and unsupported claims
-    using Ukrainian language dictionaries.
+    using language pack dictionaries.
+
+    A detector holds only read-only state; everything a detection needs is
+    kept in locals, so one instance can serve many threads at once.
     """
 
-    def __init__(self, language: str, config: Dict[str, Any]) -> None:
+    def __init__(
+        self,
+        language: str,
+        config: ConfigLike,
+        watcher: Optional[ResourceWatcher] = None,
+        resources: Optional[CompiledResources] = None,
+    ) -> None:
         """
         Initializes the detector for a specific language.
 
         Args:
             language: Language code
             config: System configuration
+            watcher: Source of hot-reloaded resources; if omitted, the
+                language pack's resources are used
+            resources: Fixed resources to use instead of the language pack's
         """
         self.language = language
         self.config = config
+        self.settings = resolve_settings(config)
+        self.watcher = watcher
 
-        # Load language resources if it's Ukrainian
-        self.resources = {}
-        if language == "uk":
-            loader = UkrainianResourceLoader()
-            self.resources = loader.load_all()
+        # Load language resources if a pack exists for the language
+        self.compiled: Optional[CompiledResources] = resources
+        if self.compiled is None and watcher is None:
+            pack = get_language_pack(language)
+            if pack is not None:
+                self.compiled = pack.compiled_resources()
 
         # Prepare pattern variables
-        self.emotion_threshold = 7  # Words with intensity >= this level are flagged
-        self.hedge_threshold = 6  # Words with uncertainty >= this level are flagged
+        self.emotion_threshold = self.settings.detector.emotion_threshold
+        self.hedge_threshold = self.settings.detector.hedge_threshold
+
+        # Load the optional claim model, shared by all detectors in the process
+        self.classifier: Optional["ClaimClassifier"] = None
+        if self.settings.detector.claim_model is not None:
+            from claim_checker.detector.classifier import load_classifier
+
+            self.classifier = load_classifier(self.settings.detector.claim_model)
+
+    def current_resources(self) -> Optional[CompiledResources]:
+        """
+        Get the resources new detections should use.
+
+        Returns:
+            Compiled resources, or None if the language is not supported
+        """
+        if self.watcher is not None:
+            return self.watcher.current
+        return self.compiled
+
+    @property
+    def resources(self) -> Mapping[str, Any]:
+        """Dictionaries of the current resource version."""
+        compiled = self.current_resources()
+        return compiled.resources if compiled else {}
 
     def detect(self, text: str, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -47,86 +114,111 @@ class EnhancedDetector:
         Returns:
             Dictionary with detection results
         """
-        # Initialize results
-        results = {
-            "logical_fallacies": [],
-            "unsupported_claims": [],
-            "consistency_issues": [],
-            "references": [],
-            "emotional_language": [],
-            "hedges": [],
-        }
+        return self.detect_batch([text], [analysis_result])[0]
 
-        # Skip detection if language is not supported
-        if not self.resources:
-            return results
+    def detect_batch(
+        self, texts: Sequence[str], analysis_results: Sequence[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Detects logical fallacies and unsupported claims in several texts.
+
+        With a claim model configured, the sentences of all texts are scored
+        in a single call.
 
-        # Find logical fallacies
-        results["logical_fallacies"] = self._detect_logical_fallacies(text)
+        Args:
+            texts: Texts to analyze
+            analysis_results: Results of linguistic analysis, one per text
 
-        # Find emotional language
-        results["emotional_language"] = self._detect_emotional_language(text)
+        Returns:
+            Dictionary with detection results for each text
+        """
+        # Take one snapshot so a reload cannot change resources mid-detection
+        compiled = self.current_resources()
 
-        # Find hedges (uncertainty markers)
-        results["hedges"] = self._detect_hedges(text)
+        # Skip detection if language is not supported
+        if compiled is None or not compiled.resources:
+            return [self._empty_results(text, compiled) for text in texts]
 
         # Find unsupported claims
-        results["unsupported_claims"] = self._detect_unsupported_claims(text)
+        unsupported_claims = self._detect_unsupported_claims_batch(texts)
 
-        return results
+        batch = []
+        for text, claims in zip(texts, unsupported_claims, strict=True):
+            results = self._empty_results(text, compiled)
 
-    def _detect_logical_fallacies(self, text: str) -> List[Dict[str, Any]]:
-        """
-        Detect logical fallacies in text.
+            # Find logical fallacies
+            results["logical_fallacies"] = self._detect_logical_fallacies(
+                text, compiled
+            )
 
-        Args:
-            text: Text to analyze
+            # Find emotional language
+            results["emotional_language"] = self._detect_emotional_language(
+                text, compiled
+            )
 
-        Returns:
-            List of logical fallacies
-        """
-        fallacies = []
+            # Find hedges (uncertainty markers)
+            results["hedges"] = self._detect_hedges(text, compiled)
 
-        # Skip if no patterns loaded
-        if "logical_patterns" not in self.resources:
-            return fallacies
+            results["unsupported_claims"] = claims
+            batch.append(results)
 
-        patterns = self.resources["logical_patterns"]
+        return batch
 
-        # For each fallacy type
-        for fallacy_type, pattern_list in patterns.items():
-            for pattern in pattern_list:
-                # Replace placeholders with regex
-                regex_pattern = self._convert_pattern_to_regex(pattern)
+    def _empty_results(
+        self, text: str, compiled: Optional[CompiledResources]
+    ) -> Dict[str, Any]:
+        """
+        Create detection results without any findings.
 
-                # Find all matches
-                for match in re.finditer(regex_pattern, text, re.IGNORECASE):
-                    fallacies.append(
-                        {
-                            "type": fallacy_type,
-                            "pattern": pattern,
-                            "match": match.group(0),
-                            "position": match.span(),
-                            "severity": self._get_fallacy_severity(fallacy_type),
-                        }
-                    )
+        Args:
+            text: Text being analyzed
+            compiled: Resources the detection uses
 
-        return fallacies
+        Returns:
+            Dictionary with empty detection results
+        """
+        return {
+            "logical_fallacies": [],
+            "unsupported_claims": [],
+            "consistency_issues": [],
+            "references": [],
+            "emotional_language": [],
+            "hedges": [],
+            "resource_version": compiled.version if compiled else None,
+            # Lets reports place character offsets within the document
+            "text_length": len(text),
+        }
 
-    def _convert_pattern_to_regex(self, pattern: str) -> str:
+    def _detect_logical_fallacies(
+        self, text: str, compiled: CompiledResources
+    ) -> List[Dict[str, Any]]:
         """
-        Convert a pattern with placeholders to regex.
+        Detect logical fallacies in text.
 
         Args:
-            pattern: Pattern with placeholders like {person}
+            text: Text to analyze
+            compiled: Resources to detect with
 
         Returns:
-            Regex pattern
+            List of logical fallacies
         """
-        # Replace placeholders with wildcard regex
-        regex = re.escape(pattern)
-        regex = re.sub(r"\\{[^}]+\\}", r"([\\w\\s]+?)", regex)
-        return regex
+        fallacies: List[Dict[str, Any]] = []
+
+        # For each precompiled fallacy pattern
+        for fallacy_type, pattern, regex in compiled.fallacy_patterns:
+            # Find all matches
+            for match in regex.finditer(text):
+                fallacies.append(
+                    {
+                        "type": fallacy_type,
+                        "pattern": pattern,
+                        "match": match.group(0),
+                        "position": match.span(),
+                        "severity": self._get_fallacy_severity(fallacy_type),
+                    }
+                )
+
+        return fallacies
 
     def _get_fallacy_severity(self, fallacy_type: str) -> str:
         """
@@ -138,36 +230,29 @@ class EnhancedDetector:
         Returns:
             Severity level (low, medium, high)
         """
-        severity_map = {
-            "ad_hominem": "high",
-            "false_dichotomy": "medium",
-            "appeal_to_authority": "medium",
-            "slippery_slope": "medium",
-            "hasty_generalization": "high",
-            "appeal_to_emotion": "medium",
-            "straw_man": "high",
-        }
-
-        return severity_map.get(fallacy_type, "medium")
+        return self.settings.severity(fallacy_type)
 
-    def _detect_emotional_language(self, text: str) -> List[Dict[str, Any]]:
+    def _detect_emotional_language(
+        self, text: str, compiled: CompiledResources
+    ) -> List[Dict[str, Any]]:
         """
         Detect emotional language in text.
 
         Args:
             text: Text to analyze
+            compiled: Resources to detect with
 
         Returns:
             List of emotional language instances
         """
-        emotional_instances = []
+        emotional_instances: List[Dict[str, Any]] = []
 
         # Skip if no emotional words loaded
-        if "emotional_words" not in self.resources:
+        if "emotional_words" not in compiled.resources:
             return emotional_instances
 
-        emotional_words = self.resources["emotional_words"]
-        intensifiers = self.resources.get("intensifiers", {})
+        emotional_words = compiled.resources["emotional_words"]
+        intensifiers = compiled.resources.get("intensifiers", {})
 
         # Tokenize text into words (simple split by space)
         words = text.lower().split()
@@ -206,32 +291,28 @@ class EnhancedDetector:
 
         return emotional_instances
 
-    def _detect_hedges(self, text: str) -> List[Dict[str, Any]]:
+    def _detect_hedges(
+        self, text: str, compiled: CompiledResources
+    ) -> List[Dict[str, Any]]:
         """
         Detect hedges (uncertainty markers) in text.
 
         Args:
             text: Text to analyze
+            compiled: Resources to detect with
 
         Returns:
             List of hedges
         """
-        hedge_instances = []
+        hedge_instances: List[Dict[str, Any]] = []
+        lowered = text.lower()
 
-        # Skip if no hedges loaded
-        if "hedges" not in self.resources:
-            return hedge_instances
-
-        hedges = self.resources["hedges"]
-
-        # For each hedge
-        for hedge, uncertainty in hedges.items():
+        # For each precompiled hedge
+        for hedge, uncertainty, regex in compiled.hedge_patterns:
             # Only include higher uncertainty hedges
             if uncertainty >= self.hedge_threshold:
                 # Find all occurrences
-                for match in re.finditer(
-                    r"\b" + re.escape(hedge) + r"\b", text.lower()
-                ):
+                for match in regex.finditer(lowered):
                     hedge_instances.append(
                         {
                             "hedge": hedge,
@@ -242,71 +323,94 @@ class EnhancedDetector:
 
         return hedge_instances
 
-    def _detect_unsupported_claims(self, text: str) -> List[Dict[str, Any]]:
+    def _detect_unsupported_claims_batch(
+        self, texts: Sequence[str]
+    ) -> List[List[Dict[str, Any]]]:
         """
-        Detect potentially unsupported claims.
+        Detect potentially unsupported claims in several texts.
 
         Args:
-            text: Text to analyze
+            texts: Texts to analyze
 
         Returns:
-            List of potentially unsupported claims
+            List of potentially unsupported claims for each text
         """
-        # Simple implementation - look for sentences with absolute statements
-        # but no references or evidence
-
-        unsupported_claims = []
-
-        # Split text into sentences (very basic)
-        sentences = re.split(r"[.!?]", text)
-
-        for i, sentence in enumerate(sentences):
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-
-            # Check if sentence contains absolute statements
-            absolute_indicators = [
-                "всі",
-                "завжди",
-                "ніколи",
-                "кожен",
-                "жоден",
-                "повністю",
-                "абсолютно",
-                "безумовно",
+        # Split texts into sentences (very basic)
+        sentences = [
+            [
+                (i, sentence.strip())
+                for i, sentence in enumerate(re.split(r"[.!?]", text))
+                if sentence.strip()
             ]
-
-            # Check if sentence has evidence markers
-            evidence_indicators = [
-                "оскільки",
-                "тому що",
-                "через те що",
-                "за даними",
-                "дослідження показують",
-                "згідно з",
-                "як свідчить",
+            for text in texts
+        ]
+
+        if self.classifier is None:
+            return [
+                [
+                    claim
+                    for i, sentence in text_sentences
+                    if (claim := self._heuristic_claim(i, sentence)) is not None
+                ]
+                for text_sentences in sentences
             ]
 
-            has_absolute = any(
-                indicator in sentence.lower() for indicator in absolute_indicators
-            )
-            has_evidence = any(
-                indicator in sentence.lower() for indicator in evidence_indicators
-            )
+        # Score every sentence of the batch in one vectorized call
+        scores = iter(
+            self.classifier.score(
+                [
+                    sentence
+                    for text_sentences in sentences
+                    for _, sentence in text_sentences
+                ]
+            ).tolist()
+        )
+        batch = []
+        for text_sentences in sentences:
+            claims = []
+            for i, sentence in text_sentences:
+                score = next(scores)
+                if score >= self.settings.detector.claim_threshold:
+                    lowered = sentence.lower()
+                    claims.append(
+                        {
+                            "sentence": sentence,
+                            "position": i,
+                            "confidence": round(score, 4),
+                            "absolute_indicators": [
+                                ind for ind in ABSOLUTE_INDICATORS if ind in lowered
+                            ],
+                        }
+                    )
+            batch.append(claims)
+        return batch
 
-            if has_absolute and not has_evidence:
-                unsupported_claims.append(
-                    {
-                        "sentence": sentence,
-                        "position": i,
-                        "confidence": 0.7,  # Confidence that this is truly unsupported
-                        "absolute_indicators": [
-                            ind
-                            for ind in absolute_indicators
-                            if ind in sentence.lower()
-                        ],
-                    }
-                )
+    def _heuristic_claim(self, i: int, sentence: str) -> Optional[Dict[str, Any]]:
+        """
+        Check a sentence for absolute statements without evidence.
 
-        return unsupported_claims
+        Args:
+            i: Position of the sentence in the text
+            sentence: Stripped sentence
+
+        Returns:
+            Unsupported claim, or None if the sentence is not one
+        """
+        lowered = sentence.lower()
+
+        # Check if sentence contains absolute statements
+        has_absolute = any(indicator in lowered for indicator in ABSOLUTE_INDICATORS)
+        # Check if sentence has evidence markers
+        has_evidence = any(indicator in lowered for indicator in EVIDENCE_INDICATORS)
+
+        if not has_absolute or has_evidence:
+            return None
+
+        return {
+            "sentence": sentence,
+            "position": i,
+            "confidence": 0.7,  # Confidence that this is truly unsupported
+            "absolute_indicators": [
+                ind for ind in ABSOLUTE_INDICATORS if ind in lowered
+            ],
+        }
@@ -0,0 +1,135 @@
+"""
+Registry of language packs.
+
+Packs are discovered without importing them, from the
+``claim_checker.languages`` entry point group and from the subpackages of
+this package. A pack is imported the first time it is used.
+"""
+
+import functools
+import importlib
+import pkgutil
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from claim_checker.languages.resources import CompiledResources, ResourceLoader
+
+ENTRY_POINT_GROUP = "claim_checker.languages"
+
+# Attribute every bundled pack exposes to create its resource loader
+LOADER_FACTORY = "create_loader"
+
+
+class LanguagePack:
+    """
+    A language pack, imported lazily on first use.
+    """
+
+    def __init__(self, code: str, target: str) -> None:
+        """
+        Initializes the pack without importing it.
+
+        Args:
+            code: Language code
+            target: Loader factory as "module:attribute"
+        """
+        self.code = code
+        self.target = target
+        self._factory: Optional[Callable[[], "ResourceLoader"]] = None
+        self._compiled: Optional["CompiledResources"] = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"LanguagePack({self.code!r}, {self.target!r})"
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the pack module has been imported."""
+        return self._factory is not None
+
+    def create_loader(self) -> "ResourceLoader":
+        """
+        Imports the pack if needed and creates a resource loader.
+
+        Returns:
+            Resource loader of the pack
+        """
+        if self._factory is None:
+            module_name, _, attribute = self.target.partition(":")
+            module = importlib.import_module(module_name)
+            self._factory = getattr(module, attribute or LOADER_FACTORY)
+        return self._factory()
+
+    def compiled_resources(self) -> "CompiledResources":
+        """
+        Loads and compiles the pack's resources once per process.
+
+        Returns:
+            Compiled resources shared by all detectors of this language
+        """
+        with self._lock:
+            if self._compiled is None:
+                from claim_checker.languages.resources import CompiledResources
+
+                loader = self.create_loader()
+                self._compiled = CompiledResources.from_loader(loader)
+        return self._compiled
+
+
+def _entry_point_packs() -> Dict[str, str]:
+    """Returns pack targets registered by installed distributions."""
+    from importlib.metadata import entry_points
+
+    return {ep.name: ep.value for ep in entry_points(group=ENTRY_POINT_GROUP)}
+
+
+def _bundled_packs() -> Dict[str, str]:
+    """Returns pack targets found by scanning this package's subpackages."""
+    return {
+        module.name: f"{__name__}.{module.name}:{LOADER_FACTORY}"
+        for module in pkgutil.iter_modules(__path__)
+        if module.ispkg
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _registry() -> Dict[str, LanguagePack]:
+    """Discovers all language packs once per process."""
+    targets = _bundled_packs()
+    # Installed packs may override bundled ones
+    targets.update(_entry_point_packs())
+    return {
+        code: LanguagePack(code, target) for code, target in sorted(targets.items())
+    }
+
+
+def available_languages() -> List[str]:
+    """
+    Lists the codes of all discovered language packs.
+
+    Returns:
+        Sorted list of language codes
+    """
+    return list(_registry())
+
+
+def get_language_pack(code: str) -> Optional[LanguagePack]:
+    """
+    Looks up a language pack without importing it.
+
+    Args:
+        code: Language code
+
+    Returns:
+        The language pack, or None if the language is not supported
+    """
+    return _registry().get(code)
+
+
+__all__ = [
+    "ENTRY_POINT_GROUP",
+    "LanguagePack",
+    "available_languages",
+    "get_language_pack",
+]
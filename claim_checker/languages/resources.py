@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Module for compiling language resources and hot-reloading them.
+"""
+
+import logging
+import re
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Pattern, Protocol, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceLoader(Protocol):
+    """
+    Interface of language resource loaders such as UkrainianResourceLoader.
+    """
+
+    def dictionary_paths(self) -> List[Path]: ...
+
+    def version(self) -> str: ...
+
+    def load_all(self) -> Dict[str, Any]: ...
+
+
+def convert_pattern_to_regex(pattern: str) -> str:
+    """
+    Convert a pattern with placeholders to regex.
+
+    Args:
+        pattern: Pattern with placeholders like {person}
+
+    Returns:
+        Regex pattern
+    """
+    # Replace placeholders with wildcard regex
+    regex = re.escape(pattern)
+    regex = re.sub(r"\\{[^}]+\\}", r"([\\w\\s]+?)", regex)
+    return regex
+
+
+def freeze(value: Any) -> Any:
+    """
+    Converts loaded resources into read-only structures.
+
+    Args:
+        value: Dictionaries, lists and scalars as returned by a loader
+
+    Returns:
+        The same data with dicts as read-only mappings and lists as tuples
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class CompiledResources:
+    """
+    Language resources together with the regular expressions built from them.
+
+    All data is frozen at construction, so one instance can be shared by any
+    number of threads, and a detector can keep using it while a newer version
+    is being compiled.
+    """
+
+    def __init__(self, resources: Dict[str, Any], version: str) -> None:
+        """
+        Compiles the patterns for a set of loaded resources.
+
+        Args:
+            resources: Dictionaries as returned by a loader's load_all
+            version: Version identifier of the resources
+        """
+        self.resources: Mapping[str, Any] = freeze(resources)
+        self.version = version
+
+        self.fallacy_patterns: Tuple[Tuple[str, str, Pattern[str]], ...] = tuple(
+            (
+                fallacy_type,
+                pattern,
+                re.compile(convert_pattern_to_regex(pattern), re.IGNORECASE),
+            )
+            for fallacy_type, pattern_list in resources.get(
+                "logical_patterns", {}
+            ).items()
+            for pattern in pattern_list
+        )
+        self.hedge_patterns: Tuple[Tuple[str, int, Pattern[str]], ...] = tuple(
+            (hedge, uncertainty, re.compile(r"\b" + re.escape(hedge) + r"\b"))
+            for hedge, uncertainty in resources.get("hedges", {}).items()
+        )
+
+    @classmethod
+    def from_loader(cls, loader: ResourceLoader) -> "CompiledResources":
+        """
+        Loads and compiles resources from a loader.
+
+        Args:
+            loader: Language resource loader
+
+        Returns:
+            Compiled resources tagged with the loader's version
+        """
+        version = loader.version()
+        return cls(loader.load_all(), version)
+
+
+class ResourceWatcher:
+    """
+    Watches dictionary files and swaps in recompiled resources when they change.
+
+    Readers take a snapshot through the ``current`` property. Replacing the
+    snapshot is a single reference assignment, so requests that already hold
+    the old version finish on it while new requests get the new one.
+    """
+
+    def __init__(self, loader: ResourceLoader, interval: float = 2.0) -> None:
+        """
+        Loads the initial resources.
+
+        Args:
+            loader: Language resource loader to watch
+            interval: Seconds between checks of the dictionary files
+        """
+        self.loader = loader
+        self.interval = interval
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stamp = self._file_stamp()
+        self._current = CompiledResources.from_loader(loader)
+
+    @property
+    def current(self) -> CompiledResources:
+        """The most recently compiled resources."""
+        return self._current
+
+    def _file_stamp(self) -> Tuple[Tuple[str, int, int], ...]:
+        """Cheap change marker built from file modification times and sizes."""
+        stamp = []
+        for path in self.loader.dictionary_paths():
+            try:
+                stat = path.stat()
+                stamp.append((str(path), stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                stamp.append((str(path), -1, -1))
+        return tuple(stamp)
+
+    def check(self) -> bool:
+        """
+        Reloads the resources if the dictionary files changed.
+
+        Returns:
+            True if a new version was swapped in
+        """
+        with self._lock:
+            stamp = self._file_stamp()
+            if stamp == self._stamp:
+                return False
+
+            compiled = CompiledResources.from_loader(self.loader)
+            # Files changed while loading; retry on the next check
+            if self.loader.version() != compiled.version:
+                return False
+
+            self._stamp = stamp
+            if compiled.version == self._current.version:
+                return False
+
+            logger.info(
+                "Reloaded language resources: %s -> %s",
+                self._current.version,
+                compiled.version,
+            )
+            self._current = compiled
+            return True
+
+    def _run(self) -> None:
+        """Background loop that polls the dictionary files."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                # Keep serving the previous version on broken dictionaries
+                logger.exception("Failed to reload language resources")
+
+    def start(self) -> None:
+        """Starts watching in a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="claim-checker-resource-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
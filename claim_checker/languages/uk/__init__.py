@@ -4,4 +4,10 @@ Ukrainian language resources and utilities.
 
 from claim_checker.languages.uk.loader import UkrainianResourceLoader
 
-__all__ = ["UkrainianResourceLoader"]
+
+def create_loader() -> UkrainianResourceLoader:
+    """Creates the resource loader of the Ukrainian language pack."""
+    return UkrainianResourceLoader()
+
+
+__all__ = ["UkrainianResourceLoader", "create_loader"]
@@ -3,19 +3,57 @@
 Module for loading Ukrainian language resources.
 """
 
+import hashlib
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+# Dictionary files that make up the Ukrainian resources
+DICTIONARY_FILES = (
+    "emotional_words.txt",
+    "intensifiers.txt",
+    "hedges.txt",
+    "logical_patterns.txt",
+)
+
 
 class UkrainianResourceLoader:
     """
     Loads dictionaries and resources for Ukrainian language analysis.
     """
 
-    def __init__(self) -> None:
-        """Initialize the loader with paths to resources."""
+    def __init__(self, dict_dir: Optional[Path] = None) -> None:
+        """
+        Initialize the loader with paths to resources.
+
+        Args:
+            dict_dir: Directory with dictionary files, defaults to the bundled one
+        """
         self.resource_dir = Path(__file__).parent
-        self.dict_dir = self.resource_dir / "dictionaries"
+        self.dict_dir = dict_dir or self.resource_dir / "dictionaries"
+
+    def dictionary_paths(self) -> List[Path]:
+        """
+        Get the paths of all dictionary files.
+
+        Returns:
+            List of dictionary file paths, including missing ones
+        """
+        return [self.dict_dir / name for name in DICTIONARY_FILES]
+
+    def version(self) -> str:
+        """
+        Compute a version identifier from the dictionary contents.
+
+        Returns:
+            Short hex digest that changes whenever any dictionary changes
+        """
+        digest = hashlib.sha256()
+        for path in self.dictionary_paths():
+            digest.update(path.name.encode("utf-8"))
+            if path.exists():
+                digest.update(path.read_bytes())
+            digest.update(b"\0")
+        return digest.hexdigest()[:12]
 
     def load_emotional_words(self) -> Dict[str, Tuple[int, int]]:
         """
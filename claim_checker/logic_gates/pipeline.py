@@ -5,13 +5,15 @@ Logic pipeline module for processing results.
 
 from typing import Any, Dict
 
+from claim_checker.config import ConfigLike
+
 
 class LogicPipeline:
     """
     Class for applying logic rules to analysis results.
     """
 
-    def __init__(self, config: Dict[str, Any]) -> None:
+    def __init__(self, config: ConfigLike) -> None:
         """
         Initializes the logic pipeline.
 
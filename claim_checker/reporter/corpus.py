@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+Corpus-level report generator module.
+
+Collects per-document issue counts into NumPy arrays and computes scores,
+percentiles and per-fallacy-type rates for whole groups of documents at once.
+Summaries are mergeable, so shards processed by different workers can be
+combined without re-reading the documents.
+"""
+
+import datetime
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from claim_checker.config import ConfigLike
+from claim_checker.reporter.reporter import (
+    EMOTIONAL_LANGUAGE_PENALTY,
+    FALLACY_PENALTY,
+    UNSUPPORTED_CLAIM_PENALTY,
+)
+
+# Order of the per-document count columns
+ISSUE_KINDS = (
+    "logical_fallacies",
+    "unsupported_claims",
+    "emotional_language",
+    "hedges",
+)
+
+# Score deduction per issue kind, aligned with ISSUE_KINDS
+PENALTIES = np.array(
+    [FALLACY_PENALTY, UNSUPPORTED_CLAIM_PENALTY, EMOTIONAL_LANGUAGE_PENALTY, 0],
+    dtype=np.int64,
+)
+
+# Scores are integers in [0, 100], so a 101-bin histogram is exact and mergeable
+SCORE_BINS = 101
+
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+GroupKey = Tuple[str, str]
+
+
+def score_counts(counts: np.ndarray) -> np.ndarray:
+    """
+    Computes overall scores for a matrix of per-document issue counts.
+
+    Args:
+        counts: Array of shape (documents, len(ISSUE_KINDS))
+
+    Returns:
+        Integer scores in [0, 100], one per document
+    """
+    deductions = counts.astype(np.int64) @ PENALTIES
+    scores: np.ndarray = np.clip(100 - deductions, 0, 100)
+    return scores
+
+
+@dataclass
+class CorpusSummary:
+    """
+    Mergeable aggregate statistics for a group of documents.
+    """
+
+    documents: int = 0
+    issue_totals: np.ndarray = field(
+        default_factory=lambda: np.zeros(len(ISSUE_KINDS), dtype=np.int64)
+    )
+    score_histogram: np.ndarray = field(
+        default_factory=lambda: np.zeros(SCORE_BINS, dtype=np.int64)
+    )
+    fallacy_counts: Dict[str, int] = field(default_factory=dict)
+    fallacy_documents: Dict[str, int] = field(default_factory=dict)
+
+    def merge(self, other: "CorpusSummary") -> "CorpusSummary":
+        """
+        Combines two summaries into a new one.
+
+        Args:
+            other: Summary to merge with
+
+        Returns:
+            Summary covering the documents of both inputs
+        """
+        fallacy_counts = dict(self.fallacy_counts)
+        for name, value in other.fallacy_counts.items():
+            fallacy_counts[name] = fallacy_counts.get(name, 0) + value
+
+        fallacy_documents = dict(self.fallacy_documents)
+        for name, value in other.fallacy_documents.items():
+            fallacy_documents[name] = fallacy_documents.get(name, 0) + value
+
+        return CorpusSummary(
+            documents=self.documents + other.documents,
+            issue_totals=self.issue_totals + other.issue_totals,
+            score_histogram=self.score_histogram + other.score_histogram,
+            fallacy_counts=dict(sorted(fallacy_counts.items())),
+            fallacy_documents=dict(sorted(fallacy_documents.items())),
+        )
+
+    def mean_score(self) -> float:
+        """Returns the mean overall score, or 100 for an empty summary."""
+        if self.documents == 0:
+            return 100.0
+        total = float(np.arange(SCORE_BINS) @ self.score_histogram)
+        return total / self.documents
+
+    def percentiles(
+        self, quantiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> Dict[str, int]:
+        """
+        Computes nearest-rank score percentiles from the histogram.
+
+        Args:
+            quantiles: Percentiles to compute, in [0, 100]
+
+        Returns:
+            Dictionary mapping "p<q>" to the score at that percentile
+        """
+        if self.documents == 0:
+            return {f"p{q:g}": 100 for q in quantiles}
+
+        ranks = np.ceil(np.asarray(quantiles, dtype=float) / 100 * self.documents)
+        ranks = np.maximum(ranks, 1)
+        cumulative = np.cumsum(self.score_histogram)
+        scores = np.searchsorted(cumulative, ranks, side="left")
+        return {f"p{q:g}": int(s) for q, s in zip(quantiles, scores, strict=True)}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes the summary into a JSON-compatible dictionary.
+
+        Returns:
+            Dictionary that can be restored with from_dict
+        """
+        return {
+            "documents": self.documents,
+            "issue_totals": dict(
+                zip(ISSUE_KINDS, self.issue_totals.tolist(), strict=True)
+            ),
+            "score_histogram": self.score_histogram.tolist(),
+            "fallacy_counts": dict(self.fallacy_counts),
+            "fallacy_documents": dict(self.fallacy_documents),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CorpusSummary":
+        """
+        Restores a summary serialized with to_dict.
+
+        Args:
+            data: Serialized summary
+
+        Returns:
+            Restored summary
+        """
+        totals = data.get("issue_totals", {})
+        return cls(
+            documents=int(data.get("documents", 0)),
+            issue_totals=np.array(
+                [totals.get(kind, 0) for kind in ISSUE_KINDS], dtype=np.int64
+            ),
+            score_histogram=np.array(
+                data.get("score_histogram", [0] * SCORE_BINS), dtype=np.int64
+            ),
+            fallacy_counts=dict(data.get("fallacy_counts", {})),
+            fallacy_documents=dict(data.get("fallacy_documents", {})),
+        )
+
+    def to_report(
+        self, quantiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> Dict[str, Any]:
+        """
+        Builds dashboard-ready statistics for this summary.
+
+        Args:
+            quantiles: Score percentiles to include
+
+        Returns:
+            Dictionary with scores, percentiles and per-document rates
+        """
+        documents = max(self.documents, 1)
+        return {
+            "documents": self.documents,
+            "mean_score": round(self.mean_score(), 3),
+            "score_percentiles": self.percentiles(quantiles),
+            "issues_per_document": {
+                kind: round(float(total) / documents, 6)
+                for kind, total in zip(
+                    ISSUE_KINDS, self.issue_totals.tolist(), strict=True
+                )
+            },
+            "fallacy_rates": {
+                name: {
+                    "per_document": round(count / documents, 6),
+                    "document_share": round(
+                        self.fallacy_documents.get(name, 0) / documents, 6
+                    ),
+                }
+                for name, count in self.fallacy_counts.items()
+            },
+        }
+
+
+def merge_summaries(
+    groups: Iterable[Dict[GroupKey, CorpusSummary]],
+) -> Dict[GroupKey, CorpusSummary]:
+    """
+    Merges grouped summaries produced by several reporters.
+
+    Args:
+        groups: Grouped summaries, e.g. one mapping per shard
+
+    Returns:
+        Combined summaries, sorted by group key
+    """
+    merged: Dict[GroupKey, CorpusSummary] = {}
+    for summaries in groups:
+        for key, summary in summaries.items():
+            merged[key] = merged[key].merge(summary) if key in merged else summary
+    return dict(sorted(merged.items()))
+
+
+class CorpusReporter:
+    """
+    Class for aggregating analysis results over a corpus of documents.
+    """
+
+    def __init__(
+        self,
+        config: ConfigLike,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        initial_capacity: int = 1024,
+    ) -> None:
+        """
+        Initializes the corpus reporter.
+
+        Args:
+            config: System configuration
+            percentiles: Score percentiles to include in reports
+            initial_capacity: Number of documents to preallocate storage for
+        """
+        self.config = config
+        self.percentiles = tuple(percentiles)
+
+        self._size = 0
+        self._counts = np.zeros((initial_capacity, len(ISSUE_KINDS)), dtype=np.int32)
+        self._groups = np.zeros(initial_capacity, dtype=np.int32)
+        self._group_index: Dict[GroupKey, int] = {}
+        self._fallacy_index: Dict[str, int] = {}
+        # Sparse (document, fallacy type, count) triples
+        self._fallacy_docs: List[int] = []
+        self._fallacy_types: List[int] = []
+        self._fallacy_hits: List[int] = []
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(
+        self,
+        results: Dict[str, Any],
+        source: str = "default",
+        day: Optional[Union[str, datetime.date]] = None,
+    ) -> None:
+        """
+        Records the results of a single document.
+
+        Args:
+            results: Analysis results, as passed to Reporter.generate_report
+            source: Name of the document source
+            day: Publication day of the document
+        """
+        if self._size == len(self._groups):
+            self._grow()
+
+        if isinstance(day, datetime.date):
+            day = day.isoformat()
+        key = (source, day or "unknown")
+        group = self._group_index.setdefault(key, len(self._group_index))
+
+        row = self._size
+        self._groups[row] = group
+        for column, kind in enumerate(ISSUE_KINDS):
+            self._counts[row, column] = len(results.get(kind, []))
+
+        per_type: Dict[str, int] = {}
+        for fallacy in results.get("logical_fallacies", []):
+            fallacy_type = fallacy.get("type", "unknown")
+            per_type[fallacy_type] = per_type.get(fallacy_type, 0) + 1
+        for fallacy_type, hits in per_type.items():
+            index = self._fallacy_index.setdefault(
+                fallacy_type, len(self._fallacy_index)
+            )
+            self._fallacy_docs.append(row)
+            self._fallacy_types.append(index)
+            self._fallacy_hits.append(hits)
+
+        self._size += 1
+
+    def add_report(
+        self,
+        report: Dict[str, Any],
+        source: str = "default",
+        day: Optional[Union[str, datetime.date]] = None,
+    ) -> None:
+        """
+        Records a document from a report produced by Reporter.generate_report.
+
+        Args:
+            report: Single-document report
+            source: Name of the document source
+            day: Publication day of the document
+        """
+        self.add(report.get("details", {}), source, day)
+
+    def _grow(self) -> None:
+        """Doubles the capacity of the per-document arrays."""
+        capacity = max(2 * len(self._groups), 1)
+        counts = np.zeros((capacity, len(ISSUE_KINDS)), dtype=np.int32)
+        counts[: self._size] = self._counts[: self._size]
+        groups = np.zeros(capacity, dtype=np.int32)
+        groups[: self._size] = self._groups[: self._size]
+        self._counts, self._groups = counts, groups
+
+    def scores(self) -> np.ndarray:
+        """
+        Returns the overall score of every recorded document.
+
+        Returns:
+            Integer scores in insertion order
+        """
+        return score_counts(self._counts[: self._size])
+
+    def summarize(self) -> Dict[GroupKey, CorpusSummary]:
+        """
+        Computes summaries for every (source, day) group.
+
+        Returns:
+            Dictionary mapping group keys to summaries, sorted by key
+        """
+        n_groups = len(self._group_index)
+        n_types = len(self._fallacy_index)
+        groups = self._groups[: self._size].astype(np.int64)
+        counts = self._counts[: self._size]
+
+        documents = np.bincount(groups, minlength=n_groups)
+        histograms = np.bincount(
+            groups * SCORE_BINS + self.scores(), minlength=n_groups * SCORE_BINS
+        ).reshape(n_groups, SCORE_BINS)
+        totals = np.zeros((n_groups, len(ISSUE_KINDS)), dtype=np.int64)
+        np.add.at(totals, groups, counts)
+
+        type_counts = np.zeros((n_groups, n_types), dtype=np.int64)
+        type_documents = np.zeros((n_groups, n_types), dtype=np.int64)
+        if self._fallacy_docs:
+            doc_groups = groups[np.asarray(self._fallacy_docs, dtype=np.int64)]
+            types = np.asarray(self._fallacy_types, dtype=np.int64)
+            np.add.at(type_counts, (doc_groups, types), self._fallacy_hits)
+            np.add.at(type_documents, (doc_groups, types), 1)
+
+        type_names = sorted(self._fallacy_index, key=self._fallacy_index.__getitem__)
+        summaries = {}
+        for key, group in self._group_index.items():
+            present = np.nonzero(type_counts[group])[0]
+            summaries[key] = CorpusSummary(
+                documents=int(documents[group]),
+                issue_totals=totals[group],
+                score_histogram=histograms[group].astype(np.int64),
+                fallacy_counts={
+                    type_names[i]: int(type_counts[group, i]) for i in present
+                },
+                fallacy_documents={
+                    type_names[i]: int(type_documents[group, i]) for i in present
+                },
+            )
+
+        return dict(sorted(summaries.items()))
+
+    def generate_report(
+        self, summaries: Optional[Dict[GroupKey, CorpusSummary]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generates per-source and per-day aggregate reports.
+
+        Args:
+            summaries: Precomputed (possibly merged) summaries; defaults to the
+                summaries of the documents recorded by this reporter
+
+        Returns:
+            Report as a dictionary
+        """
+        if summaries is None:
+            summaries = self.summarize()
+        return build_corpus_report(summaries, self.percentiles)
+
+
+def build_corpus_report(
+    summaries: Dict[GroupKey, CorpusSummary],
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> Dict[str, Any]:
+    """
+    Builds an aggregate report from grouped summaries.
+
+    Args:
+        summaries: Summaries keyed by (source, day)
+        percentiles: Score percentiles to include
+
+    Returns:
+        Report with overall, per-source and per-day statistics
+    """
+    by_source: Dict[str, CorpusSummary] = {}
+    by_day: Dict[str, CorpusSummary] = {}
+    overall = CorpusSummary()
+    for (source, day), summary in sorted(summaries.items()):
+        by_source[source] = (
+            by_source[source].merge(summary) if source in by_source else summary
+        )
+        by_day[day] = by_day[day].merge(summary) if day in by_day else summary
+        overall = overall.merge(summary)
+
+    return {
+        "overall": overall.to_report(percentiles),
+        "by_source": {
+            name: summary.to_report(percentiles)
+            for name, summary in sorted(by_source.items())
+        },
+        "by_day": {
+            name: summary.to_report(percentiles)
+            for name, summary in sorted(by_day.items())
+        },
+    }
@@ -3,7 +3,16 @@
 Report generator module.
 """
 
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from claim_checker.config import ConfigLike
+from claim_checker.reporter.visualizations import CHART_KINDS, get_visualizer
+
+# Points deducted from the overall score per detected issue
+FALLACY_PENALTY = 5
+UNSUPPORTED_CLAIM_PENALTY = 3
+EMOTIONAL_LANGUAGE_PENALTY = 1
 
 
 class Reporter:
@@ -11,7 +20,7 @@ class Reporter:
     Class for generating reports based on analysis results.
     """
 
-    def __init__(self, language: str, config: Dict[str, Any]) -> None:
+    def __init__(self, language: str, config: ConfigLike) -> None:
         """
         Initializes the report generator for a specific language.
 
@@ -46,9 +55,9 @@ class Reporter:
         score = 100
         if total_issues > 0:
             # Deduct points based on issues found
-            score -= fallacies_count * 5  # 5 points per logical fallacy
-            score -= unsupported_count * 3  # 3 points per unsupported claim
-            score -= emotional_count * 1  # 1 point per emotional language
+            score -= fallacies_count * FALLACY_PENALTY
+            score -= unsupported_count * UNSUPPORTED_CLAIM_PENALTY
+            score -= emotional_count * EMOTIONAL_LANGUAGE_PENALTY
             score = max(0, score)  # Ensure score is not negative
 
         # Generate recommendations
@@ -65,7 +74,28 @@ class Reporter:
                 "issues_count": total_issues,
                 "overall_score": score,
                 "recommendations": recommendations,
+                "resource_version": results.get("resource_version"),
             },
             "details": results,
-            "visualizations": {},
+            # Charts are rendered on demand by render_visualizations
+            "visualizations": {"charts": list(CHART_KINDS)},
         }
+
+    def render_visualizations(
+        self,
+        report: Dict[str, Any],
+        kinds: Iterable[str] = CHART_KINDS,
+        cache_dir: Optional[Path] = None,
+    ) -> Dict[str, bytes]:
+        """
+        Renders charts for a report, reusing images cached for its content.
+
+        Args:
+            report: Report produced by generate_report
+            kinds: Charts to render
+            cache_dir: Directory to also keep rendered images in across runs
+
+        Returns:
+            Dictionary mapping chart kind to PNG image
+        """
+        return get_visualizer(cache_dir).render_all(report, kinds)
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+On-demand chart rendering for reports.
+
+Charts are never drawn while a report is generated. They are rendered when
+requested, on a background thread with matplotlib's Agg backend, and cached
+by the content hash of the report, so viewing the same report again costs a
+dictionary lookup. matplotlib is only imported by the first render.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Charts that can be rendered for a report
+CHART_KINDS = ("fallacy_types", "emotion_timeline", "hedge_density")
+
+# Number of segments the hedge density map splits a document into
+DENSITY_BINS = 50
+
+# Rendered images kept in memory
+DEFAULT_CACHE_SIZE = 128
+
+FIGURE_SIZE = (8.0, 3.0)
+DPI = 100
+
+ChartKey = Tuple[str, str]
+
+# Visualizers shared by all callers, keyed by cache directory
+_visualizers: Dict[Optional[Path], "Visualizer"] = {}
+_visualizers_lock = threading.Lock()
+
+
+def report_hash(report: Dict[str, Any]) -> str:
+    """
+    Computes the content hash of a report.
+
+    Args:
+        report: Report produced by Reporter.generate_report
+
+    Returns:
+        SHA-256 of the canonical JSON of the report's summary and details
+    """
+    content = {key: report.get(key) for key in ("summary", "details")}
+    canonical = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def fallacy_type_counts(details: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Counts detected logical fallacies by type.
+
+    Args:
+        details: Detection results of a report
+
+    Returns:
+        Dictionary mapping fallacy type to count, sorted by type
+    """
+    counts: Dict[str, int] = {}
+    for fallacy in details.get("logical_fallacies", []):
+        fallacy_type = fallacy.get("type", "unknown")
+        counts[fallacy_type] = counts.get(fallacy_type, 0) + 1
+    return dict(sorted(counts.items()))
+
+
+def emotion_timeline(details: Dict[str, Any]) -> List[Tuple[int, int]]:
+    """
+    Lists emotional words by their position in the document.
+
+    Args:
+        details: Detection results of a report
+
+    Returns:
+        (word offset, signed intensity) pairs in document order
+    """
+    points = []
+    for instance in details.get("emotional_language", []):
+        sign = -1 if instance.get("polarity") == "negative" else 1
+        points.append((int(instance["position"]), sign * int(instance["intensity"])))
+    return sorted(points)
+
+
+def hedge_density(details: Dict[str, Any], bins: int = DENSITY_BINS) -> List[int]:
+    """
+    Sums hedge uncertainty over equal segments of the document.
+
+    Args:
+        details: Detection results of a report
+        bins: Number of segments
+
+    Returns:
+        Total uncertainty of the hedges starting in each segment
+    """
+    hedges = details.get("hedges", [])
+    length = details.get("text_length") or max(
+        (int(hedge["position"][1]) for hedge in hedges), default=0
+    )
+    density = [0] * bins
+    for hedge in hedges:
+        start = int(hedge["position"][0])
+        density[min(start * bins // max(length, 1), bins - 1)] += int(
+            hedge["uncertainty"]
+        )
+    return density
+
+
+def _new_figure() -> Any:
+    """Creates a figure drawn by the Agg backend, without pyplot state."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=FIGURE_SIZE, dpi=DPI, layout="tight")
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def _to_png(figure: Any) -> bytes:
+    """Encodes a figure as PNG."""
+    import io
+
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png")
+    return buffer.getvalue()
+
+
+def render_fallacy_types(details: Dict[str, Any]) -> bytes:
+    """Renders a bar chart of logical fallacies by type."""
+    counts = fallacy_type_counts(details)
+    figure = _new_figure()
+    axes = figure.add_subplot()
+    axes.barh(list(counts), list(counts.values()))
+    axes.invert_yaxis()
+    axes.set_xlabel("Occurrences")
+    axes.set_title("Logical fallacies by type")
+    if not counts:
+        axes.text(0.5, 0.5, "No fallacies", ha="center", transform=axes.transAxes)
+    return _to_png(figure)
+
+
+def render_emotion_timeline(details: Dict[str, Any]) -> bytes:
+    """Renders emotional intensity over word offsets."""
+    points = emotion_timeline(details)
+    figure = _new_figure()
+    axes = figure.add_subplot()
+    if points:
+        offsets, intensities = zip(*points, strict=True)
+        axes.stem(offsets, intensities)
+    axes.axhline(0, linewidth=0.5, color="grey")
+    axes.set_xlabel("Word offset")
+    axes.set_ylabel("Intensity")
+    axes.set_title("Emotional language")
+    return _to_png(figure)
+
+
+def render_hedge_density(details: Dict[str, Any]) -> bytes:
+    """Renders hedge uncertainty across the document as a heat strip."""
+    density = hedge_density(details)
+    figure = _new_figure()
+    axes = figure.add_subplot()
+    image = axes.imshow(
+        [density], aspect="auto", cmap="Oranges", vmin=0, vmax=max(max(density), 1)
+    )
+    axes.set_yticks([])
+    axes.set_xticks([0, len(density) - 1], ["start", "end"])
+    axes.set_title("Hedge density")
+    figure.colorbar(image, ax=axes, label="Uncertainty")
+    return _to_png(figure)
+
+
+RENDERERS: Dict[str, Callable[[Dict[str, Any]], bytes]] = {
+    "fallacy_types": render_fallacy_types,
+    "emotion_timeline": render_emotion_timeline,
+    "hedge_density": render_hedge_density,
+}
+
+
+class Visualizer:
+    """
+    Renders report charts on a background thread and caches the images.
+    """
+
+    def __init__(
+        self, cache_dir: Optional[Path] = None, cache_size: int = DEFAULT_CACHE_SIZE
+    ) -> None:
+        """
+        Initializes the visualizer.
+
+        Args:
+            cache_dir: Directory to also keep rendered images in across runs
+            cache_size: Number of images kept in memory
+        """
+        self.cache_dir = cache_dir
+        self.cache_size = cache_size
+
+        self._cache: "OrderedDict[ChartKey, bytes]" = OrderedDict()
+        self._pending: Dict[ChartKey, "Future[bytes]"] = {}
+        self._lock = threading.Lock()
+        # One thread keeps matplotlib off the analysis threads
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="claim-checker-render"
+        )
+
+    def _cache_path(self, key: ChartKey) -> Optional[Path]:
+        """Returns where an image is kept on disk, if a cache directory is set."""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{key[0]}-{key[1]}.png"
+
+    def _remember(self, key: ChartKey, image: bytes) -> None:
+        """Adds an image to the in-memory cache. Must hold the lock."""
+        self._cache[key] = image
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _render(self, key: ChartKey, details: Dict[str, Any]) -> bytes:
+        """Renders one chart on the worker thread and stores the image."""
+        try:
+            path = self._cache_path(key)
+            if path is not None and path.exists():
+                image = path.read_bytes()
+            else:
+                image = RENDERERS[key[1]](details)
+                if path is not None:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = path.with_name(
+                        f"{path.name}.tmp-{threading.get_ident()}"
+                    )
+                    tmp_path.write_bytes(image)
+                    tmp_path.replace(path)
+
+            with self._lock:
+                self._remember(key, image)
+            return image
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def submit(self, report: Dict[str, Any], kind: str) -> "Future[bytes]":
+        """
+        Schedules rendering of a chart, reusing cached or in-flight images.
+
+        Args:
+            report: Report produced by Reporter.generate_report
+            kind: One of CHART_KINDS
+
+        Returns:
+            Future resolving to the PNG image
+        """
+        if kind not in RENDERERS:
+            raise ValueError(f"Unknown chart: {kind}")
+        key = (report_hash(report), kind)
+
+        with self._lock:
+            image = self._cache.get(key)
+            if image is not None:
+                self._cache.move_to_end(key)
+                future: "Future[bytes]" = Future()
+                future.set_result(image)
+                return future
+
+            # The worker cannot finish before the lock is released
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._executor.submit(
+                    self._render, key, report.get("details", {})
+                )
+                self._pending[key] = pending
+            return pending
+
+    def render(
+        self, report: Dict[str, Any], kind: str, timeout: Optional[float] = None
+    ) -> bytes:
+        """
+        Renders a chart, waiting for the background worker.
+
+        Args:
+            report: Report produced by Reporter.generate_report
+            kind: One of CHART_KINDS
+            timeout: Seconds to wait for the image
+
+        Returns:
+            PNG image
+        """
+        return self.submit(report, kind).result(timeout)
+
+    def render_all(
+        self, report: Dict[str, Any], kinds: Iterable[str] = CHART_KINDS
+    ) -> Dict[str, bytes]:
+        """
+        Renders several charts of a report.
+
+        Args:
+            report: Report produced by Reporter.generate_report
+            kinds: Charts to render
+
+        Returns:
+            Dictionary mapping chart kind to PNG image
+        """
+        futures = {kind: self.submit(report, kind) for kind in kinds}
+        return {kind: future.result() for kind, future in futures.items()}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the background worker.
+
+        Args:
+            wait: Whether to wait for running renders to finish
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def get_visualizer(cache_dir: Optional[Path] = None) -> Visualizer:
+    """
+    Returns the shared visualizer for a cache directory, creating it if needed.
+
+    Args:
+        cache_dir: Directory to also keep rendered images in across runs
+
+    Returns:
+        Shared visualizer
+    """
+    with _visualizers_lock:
+        visualizer = _visualizers.get(cache_dir)
+        if visualizer is None:
+            visualizer = Visualizer(cache_dir)
+            _visualizers[cache_dir] = visualizer
+    return visualizer
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+Sharded corpus runs without a coordination service.
+
+A run has three steps, each of which can be executed on a different machine
+as long as they share the run directory:
+
+1. ``plan`` splits a corpus into shards and writes ``manifest.json``.
+2. ``run_shard`` analyzes one shard and writes its reports and summary.
+   A shard is complete once its summary exists, so failed or interrupted
+   shards are simply run again, and completed ones are skipped.
+3. ``merge`` combines the shard outputs in manifest order into one report
+   file and one corpus report, so the result does not depend on which
+   shard finished first.
+
+A corpus is a JSONL file, a text file, or a directory of them. JSONL lines
+hold ``text`` and optionally ``id``, ``source`` and ``day``; every other
+file is one document.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from claim_checker.config import ConfigLike, resolve_settings
+from claim_checker.core import AnalysisComponents
+from claim_checker.reporter.corpus import (
+    CorpusReporter,
+    CorpusSummary,
+    GroupKey,
+    build_corpus_report,
+    merge_summaries,
+)
+
+# Version of the manifest and shard summary layout
+MANIFEST_FORMAT = 1
+
+MANIFEST_NAME = "manifest.json"
+SHARDS_DIR = "shards"
+REPORTS_NAME = "reports.jsonl"
+CORPUS_REPORT_NAME = "corpus_report.json"
+
+# Suffixes of files read as JSONL and as plain text
+JSONL_SUFFIXES = (".jsonl",)
+TEXT_SUFFIXES = (".txt",)
+
+# Documents analyzed per detector call
+DEFAULT_BATCH_SIZE = 256
+
+Document = Dict[str, Any]
+
+
+class ShardError(Exception):
+    """Raised when a run directory is missing, inconsistent or incomplete."""
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    """Writes a file so that readers never see it half-written."""
+    tmp_path = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    tmp_path.write_text(content, "utf-8")
+    os.replace(tmp_path, path)
+
+
+def _dump(data: Any) -> str:
+    """Serializes data as canonical JSON."""
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, indent=2) + "\n"
+
+
+def _file_sha256(path: Path) -> str:
+    """Returns the SHA-256 digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def corpus_files(corpus: Path) -> List[Path]:
+    """
+    Lists the files of a corpus in a stable order.
+
+    Args:
+        corpus: Corpus file or directory
+
+    Returns:
+        Sorted list of corpus files
+    """
+    if corpus.is_file():
+        return [corpus]
+    if not corpus.is_dir():
+        raise FileNotFoundError(f"Corpus not found: {corpus}")
+    suffixes = JSONL_SUFFIXES + TEXT_SUFFIXES
+    return sorted(
+        path for path in corpus.rglob("*") if path.is_file() and path.suffix in suffixes
+    )
+
+
+def _input_units(corpus: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yields the smallest units a corpus can be split into.
+
+    A unit is one line of a JSONL file, addressed by its byte range, or one
+    whole text file, whose source is its directory within the corpus.
+    """
+    for path in corpus_files(corpus):
+        if path.suffix not in JSONL_SUFFIXES:
+            parent = path.parent.relative_to(corpus) if corpus.is_dir() else None
+            source = parent.as_posix() if parent and parent.parts else "default"
+            yield {"path": str(path), "source": source}
+            continue
+
+        with open(path, "rb") as f:
+            offset = 0
+            for line in f:
+                if line.strip():
+                    yield {
+                        "path": str(path),
+                        "start": offset,
+                        "end": offset + len(line),
+                    }
+                offset += len(line)
+
+
+def _append_unit(inputs: List[Dict[str, Any]], unit: Dict[str, Any]) -> None:
+    """Adds a unit to a shard, joining consecutive lines of the same file."""
+    if inputs and "start" in unit and "start" in inputs[-1]:
+        last = inputs[-1]
+        if last["path"] == unit["path"]:
+            last["end"] = unit["end"]
+            return
+    inputs.append(dict(unit))
+
+
+def plan(
+    corpus: Path,
+    run_dir: Path,
+    shard_size: int,
+    config: ConfigLike,
+    language: str = "uk",
+) -> Dict[str, Any]:
+    """
+    Splits a corpus into shards and writes the manifest.
+
+    Args:
+        corpus: Corpus file or directory
+        run_dir: Directory holding the manifest and shard outputs
+        shard_size: Maximum number of documents per shard
+        config: System configuration
+        language: Language code
+
+    Returns:
+        The manifest
+    """
+    if shard_size < 1:
+        raise ValueError("Shard size must be at least 1")
+
+    # Shards may run from another working directory
+    corpus = corpus.resolve()
+    manifest_path = run_dir / MANIFEST_NAME
+    if manifest_path.exists():
+        raise ShardError(f"A run is already planned in {run_dir}")
+
+    shards: List[Dict[str, Any]] = []
+    inputs: List[Dict[str, Any]] = []
+    documents = 0
+    for unit in _input_units(corpus):
+        _append_unit(inputs, unit)
+        documents += 1
+        if documents == shard_size:
+            shards.append({"documents": documents, "inputs": inputs})
+            inputs, documents = [], 0
+    if documents:
+        shards.append({"documents": documents, "inputs": inputs})
+
+    width = max(5, len(str(len(shards))))
+    manifest = {
+        "format": MANIFEST_FORMAT,
+        "corpus": str(corpus),
+        "language": language,
+        "settings_fingerprint": resolve_settings(config).fingerprint,
+        "documents": sum(shard["documents"] for shard in shards),
+        "shards": [
+            {"id": f"shard-{index:0{width}d}", **shard}
+            for index, shard in enumerate(shards)
+        ],
+    }
+
+    (run_dir / SHARDS_DIR).mkdir(parents=True, exist_ok=True)
+    _write_atomic(manifest_path, _dump(manifest))
+    return manifest
+
+
+def load_manifest(run_dir: Path) -> Dict[str, Any]:
+    """
+    Reads the manifest of a run.
+
+    Args:
+        run_dir: Run directory
+
+    Returns:
+        The manifest
+    """
+    manifest_path = run_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        raise ShardError(f"No manifest in {run_dir}; run plan first")
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest: Dict[str, Any] = json.load(f)
+    if manifest.get("format") != MANIFEST_FORMAT:
+        raise ShardError(f"Unsupported manifest format in {manifest_path}")
+    return manifest
+
+
+def _get_shard(manifest: Dict[str, Any], shard_id: str) -> Dict[str, Any]:
+    """Looks up a shard of the manifest by id."""
+    shards: List[Dict[str, Any]] = manifest["shards"]
+    for shard in shards:
+        if shard["id"] == shard_id:
+            return shard
+    raise ShardError(f"Unknown shard: {shard_id}")
+
+
+def shard_paths(run_dir: Path, shard_id: str) -> Tuple[Path, Path]:
+    """
+    Returns the output paths of a shard.
+
+    Args:
+        run_dir: Run directory
+        shard_id: Shard id from the manifest
+
+    Returns:
+        Paths of the shard's report file and summary file
+    """
+    shard_dir = run_dir / SHARDS_DIR
+    return (
+        shard_dir / f"{shard_id}.reports.jsonl",
+        shard_dir / f"{shard_id}.summary.json",
+    )
+
+
+def read_documents(inputs: List[Dict[str, Any]]) -> Iterator[Document]:
+    """
+    Reads the documents of a shard.
+
+    Args:
+        inputs: Input units of the shard, as stored in the manifest
+
+    Yields:
+        Documents with id, text, source and day
+    """
+    for unit in inputs:
+        path = Path(unit["path"])
+        if "start" not in unit:
+            yield {
+                "id": str(path),
+                "text": path.read_text("utf-8"),
+                "source": unit["source"],
+                "day": None,
+            }
+            continue
+
+        with open(path, "rb") as f:
+            f.seek(unit["start"])
+            data = f.read(unit["end"] - unit["start"])
+        offset = unit["start"]
+        for line in data.splitlines(keepends=True):
+            if line.strip():
+                yield _parse_record(line, path, offset)
+            offset += len(line)
+
+
+def _parse_record(line: bytes, path: Path, offset: int) -> Document:
+    """
+    Converts one JSONL line into a document.
+
+    Args:
+        line: Raw line
+        path: File the line was read from
+        offset: Byte offset of the line in the file
+
+    Returns:
+        Document with id, text, source and day as strings
+
+    Raises:
+        ShardError: If the line is not a JSON object with a text string
+    """
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        raise ShardError(f"{path}:{offset}: invalid JSON: {e}") from e
+    if not isinstance(record, dict):
+        raise ShardError(f"{path}:{offset}: expected a JSON object")
+    text = record.get("text", "")
+    if not isinstance(text, str):
+        raise ShardError(f"{path}:{offset}: 'text' must be a string")
+
+    source = record.get("source")
+    day = record.get("day")
+    return {
+        "id": str(record.get("id", f"{path}:{offset}")),
+        "text": text,
+        "source": "default" if source is None else str(source),
+        "day": None if day is None else str(day),
+    }
+
+
+def is_complete(run_dir: Path, shard_id: str) -> bool:
+    """
+    Checks whether a shard has finished.
+
+    Args:
+        run_dir: Run directory
+        shard_id: Shard id from the manifest
+
+    Returns:
+        True if the shard's summary was written
+    """
+    return shard_paths(run_dir, shard_id)[1].exists()
+
+
+def pending_shards(run_dir: Path) -> List[str]:
+    """
+    Lists the shards that still have to be run.
+
+    Args:
+        run_dir: Run directory
+
+    Returns:
+        Ids of incomplete shards, in manifest order
+    """
+    manifest = load_manifest(run_dir)
+    return [
+        shard["id"]
+        for shard in manifest["shards"]
+        if not is_complete(run_dir, shard["id"])
+    ]
+
+
+def run_shard(
+    run_dir: Path,
+    shard_id: str,
+    config: ConfigLike,
+    force: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Optional[Dict[str, Any]]:
+    """
+    Analyzes one shard and writes its reports and summary.
+
+    The summary is written last, after the reports are in place, so a shard
+    that fails part-way is seen as pending and can simply be run again.
+
+    Args:
+        run_dir: Run directory
+        shard_id: Shard id from the manifest
+        config: System configuration
+        force: Re-run the shard even if it is complete
+        batch_size: Documents analyzed per detector call
+
+    Returns:
+        The shard summary, or None if the shard was already complete
+    """
+    manifest = load_manifest(run_dir)
+    shard = _get_shard(manifest, shard_id)
+    settings = resolve_settings(config)
+    if settings.fingerprint != manifest["settings_fingerprint"]:
+        raise ShardError("Configuration differs from the one the run was planned with")
+
+    reports_path, summary_path = shard_paths(run_dir, shard_id)
+    if summary_path.exists():
+        if not force:
+            return None
+        summary_path.unlink()
+
+    components = AnalysisComponents(manifest["language"], settings)
+    reporter = CorpusReporter(settings, initial_capacity=shard["documents"])
+
+    tmp_path = reports_path.with_name(f"{reports_path.name}.tmp-{os.getpid()}")
+    with open(tmp_path, "w", encoding="utf-8") as out:
+        batch: List[Document] = []
+
+        def flush() -> None:
+            reports = components.analyze_batch([doc["text"] for doc in batch])
+            for doc, report in zip(batch, reports, strict=True):
+                reporter.add_report(report, doc["source"], doc["day"])
+                record = {key: doc[key] for key in ("id", "source", "day")}
+                record["report"] = report
+                out.write(json.dumps(record, ensure_ascii=False, sort_keys=True))
+                out.write("\n")
+            batch.clear()
+
+        for document in read_documents(shard["inputs"]):
+            batch.append(document)
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+    os.replace(tmp_path, reports_path)
+
+    if len(reporter) != shard["documents"]:
+        raise ShardError(
+            f"{shard_id}: expected {shard['documents']} documents, "
+            f"read {len(reporter)}; the corpus changed since planning"
+        )
+
+    summary = {
+        "format": MANIFEST_FORMAT,
+        "shard": shard_id,
+        "documents": len(reporter),
+        "reports_sha256": _file_sha256(reports_path),
+        "groups": [
+            {"source": source, "day": day, "summary": group.to_dict()}
+            for (source, day), group in reporter.summarize().items()
+        ],
+    }
+    _write_atomic(summary_path, _dump(summary))
+    return summary
+
+
+def _load_summaries(
+    run_dir: Path, shard_id: str, verify: bool
+) -> Dict[GroupKey, CorpusSummary]:
+    """Reads the grouped summaries of a completed shard."""
+    reports_path, summary_path = shard_paths(run_dir, shard_id)
+    with open(summary_path, "r", encoding="utf-8") as f:
+        summary = json.load(f)
+    if verify and _file_sha256(reports_path) != summary["reports_sha256"]:
+        raise ShardError(f"{shard_id}: reports do not match the shard summary")
+    return {
+        (group["source"], group["day"]): CorpusSummary.from_dict(group["summary"])
+        for group in summary["groups"]
+    }
+
+
+def merge(run_dir: Path, verify: bool = True) -> Dict[str, Any]:
+    """
+    Combines the outputs of all shards.
+
+    Reports are concatenated and summaries merged in manifest order, so the
+    output is identical however the shards were scheduled.
+
+    Args:
+        run_dir: Run directory
+        verify: Check every shard's reports against its summary
+
+    Returns:
+        The corpus report
+    """
+    manifest = load_manifest(run_dir)
+    pending = pending_shards(run_dir)
+    if pending:
+        raise ShardError(f"Shards not complete: {', '.join(pending)}")
+
+    shard_ids = [shard["id"] for shard in manifest["shards"]]
+    summaries = merge_summaries(
+        _load_summaries(run_dir, shard_id, verify) for shard_id in shard_ids
+    )
+
+    tmp_path = run_dir / f"{REPORTS_NAME}.tmp-{os.getpid()}"
+    with open(tmp_path, "wb") as out:
+        for shard_id in shard_ids:
+            with open(shard_paths(run_dir, shard_id)[0], "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    out.write(chunk)
+    os.replace(tmp_path, run_dir / REPORTS_NAME)
+
+    report = build_corpus_report(summaries)
+    report["shards"] = len(shard_ids)
+    _write_atomic(run_dir / CORPUS_REPORT_NAME, _dump(report))
+    return report
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Worker pools for running analyses off the caller's thread.
+
+Two backends are available:
+
+- ``thread``: all workers share one set of analysis components and therefore
+  one copy of the compiled language resources. On free-threaded CPython
+  builds this gives multi-core throughput without per-process copies.
+- ``process``: each worker process keeps its own warm components per
+  language. This is the only way to use several cores on GIL builds.
+
+The ``auto`` backend picks threads when the GIL is disabled and processes
+otherwise.
+
+With ``hot_reload`` enabled, every pool (and every worker process) watches
+the language dictionaries and picks up edits without a restart.
+"""
+
+import multiprocessing
+import os
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
+
+from claim_checker.config import ConfigLike, Settings, resolve_settings
+from claim_checker.core import AnalysisComponents
+from claim_checker.languages import get_language_pack
+from claim_checker.languages.resources import ResourceWatcher
+
+Backend = Literal["auto", "thread", "process"]
+
+# Pools shared by all callers, keyed by settings fingerprint, size, backend
+# and hot reloading
+_pools: Dict[Tuple[str, int, str, bool], "AnalysisPool"] = {}
+_pools_lock = threading.Lock()
+
+# Worker-side state, set up by _init_worker in every worker process
+_worker_config: Optional[Settings] = None
+_worker_hot_reload = False
+_worker_components: Dict[str, AnalysisComponents] = {}
+
+
+def default_workers() -> int:
+    """Returns the default number of workers, one per available CPU."""
+    return os.cpu_count() or 1
+
+
+def gil_enabled() -> bool:
+    """Returns whether the running interpreter has the GIL enabled."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+def resolve_backend(backend: Backend) -> str:
+    """
+    Resolves the auto backend for the running interpreter.
+
+    Args:
+        backend: Requested backend
+
+    Returns:
+        Either "thread" or "process"
+    """
+    if backend == "auto":
+        return "process" if gil_enabled() else "thread"
+    if backend not in ("thread", "process"):
+        raise ValueError(f"Unknown worker backend: {backend}")
+    return backend
+
+
+def start_watcher(language: str) -> Optional[ResourceWatcher]:
+    """
+    Starts watching the dictionaries of a language.
+
+    Args:
+        language: Language code
+
+    Returns:
+        Running watcher, or None if there is no pack for the language
+    """
+    pack = get_language_pack(language)
+    if pack is None:
+        return None
+    watcher = ResourceWatcher(pack.create_loader())
+    watcher.start()
+    return watcher
+
+
+def _init_worker(config: ConfigLike, hot_reload: bool = False) -> None:
+    """
+    Prepares a worker process and warms up the default language.
+
+    Args:
+        config: System configuration
+        hot_reload: Whether to watch the dictionaries for changes
+    """
+    global _worker_config, _worker_hot_reload
+    _worker_config = resolve_settings(config)
+    _worker_hot_reload = hot_reload
+    _worker_components.clear()
+    get_worker_components(_worker_config.default_language)
+
+
+def get_worker_components(language: str) -> AnalysisComponents:
+    """
+    Returns the warm components of the current worker process for a language.
+
+    Args:
+        language: Language code
+
+    Returns:
+        Components created on first use and reused afterwards
+    """
+    if _worker_config is None:
+        raise RuntimeError("Worker was not initialized")
+    components = _worker_components.get(language)
+    if components is None:
+        # The watcher thread lives as long as the worker process
+        watcher = start_watcher(language) if _worker_hot_reload else None
+        components = AnalysisComponents(language, _worker_config, watcher)
+        _worker_components[language] = components
+    return components
+
+
+def analyze_in_worker(text: str, language: str) -> Dict[str, Any]:
+    """
+    Analyzes a text with the warm components of the current worker process.
+
+    Args:
+        text: Text to analyze
+        language: Language code
+
+    Returns:
+        Dictionary with analysis results
+    """
+    return get_worker_components(language).analyze(text)
+
+
+class AnalysisPool:
+    """
+    Pool of workers running analyses for one configuration.
+    """
+
+    def __init__(
+        self,
+        config: ConfigLike,
+        max_workers: Optional[int] = None,
+        backend: Backend = "auto",
+        hot_reload: bool = False,
+    ) -> None:
+        """
+        Starts the pool.
+
+        Args:
+            config: System configuration
+            max_workers: Number of workers, defaults to the CPU count
+            backend: "thread", "process" or "auto"
+            hot_reload: Whether to pick up dictionary edits while running
+        """
+        self.config = resolve_settings(config)
+        self.max_workers = max_workers or default_workers()
+        self.backend = resolve_backend(backend)
+        self.hot_reload = hot_reload
+
+        self._components: Dict[str, AnalysisComponents] = {}
+        self._watchers: List[ResourceWatcher] = []
+        self._components_lock = threading.Lock()
+
+        self.executor: Executor
+        if self.backend == "thread":
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="claim-checker"
+            )
+        else:
+            # Spawned workers do not inherit threads or event loops of the parent
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.config, hot_reload),
+            )
+
+    def components(self, language: str) -> AnalysisComponents:
+        """
+        Returns the components shared by all threads of a thread pool.
+
+        Args:
+            language: Language code
+
+        Returns:
+            Stateless components created once per pool and language
+        """
+        with self._components_lock:
+            components = self._components.get(language)
+            if components is None:
+                watcher = start_watcher(language) if self.hot_reload else None
+                if watcher is not None:
+                    self._watchers.append(watcher)
+                components = AnalysisComponents(language, self.config, watcher)
+                self._components[language] = components
+        return components
+
+    def _analyze_shared(self, text: str, language: str) -> Dict[str, Any]:
+        """Analyzes a text on a pool thread with the shared components."""
+        return self.components(language).analyze(text)
+
+    def submit(self, text: str, language: str) -> "Future[Dict[str, Any]]":
+        """
+        Schedules the analysis of a text.
+
+        Args:
+            text: Text to analyze
+            language: Language code
+
+        Returns:
+            Future resolving to the analysis report
+        """
+        if self.backend == "thread":
+            return self.executor.submit(self._analyze_shared, text, language)
+        return self.executor.submit(analyze_in_worker, text, language)
+
+    def imap(
+        self, texts: Iterable[str], language: str, window: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Analyzes texts in parallel, yielding reports in input order.
+
+        Only ``window`` texts are scheduled ahead of the consumer, so large or
+        unbounded inputs are never read into memory at once.
+
+        Args:
+            texts: Texts to analyze
+            language: Language code
+            window: Texts in flight, defaults to twice the number of workers
+
+        Yields:
+            Dictionary with analysis results for each text
+        """
+        window = window or 2 * self.max_workers
+        pending: Deque["Future[Dict[str, Any]]"] = deque()
+        try:
+            for text in texts:
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+                pending.append(self.submit(text, language))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the workers.
+
+        Args:
+            wait: Whether to wait for running work to finish
+        """
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+        with self._components_lock:
+            watchers, self._watchers = self._watchers, []
+        for watcher in watchers:
+            watcher.stop()
+
+
+def get_pool(
+    config: ConfigLike,
+    max_workers: Optional[int] = None,
+    backend: Backend = "auto",
+    hot_reload: bool = False,
+) -> AnalysisPool:
+    """
+    Returns the shared pool for a configuration, creating it if needed.
+
+    Args:
+        config: System configuration
+        max_workers: Number of workers, defaults to the CPU count
+        backend: "thread", "process" or "auto"
+        hot_reload: Whether to pick up dictionary edits while running
+
+    Returns:
+        Shared analysis pool
+    """
+    settings = resolve_settings(config)
+    workers = max_workers or default_workers()
+    key = (settings.fingerprint, workers, resolve_backend(backend), hot_reload)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = AnalysisPool(settings, workers, backend, hot_reload)
+            _pools[key] = pool
+    return pool
+
+
+def analyze_batch(
+    texts: Iterable[str],
+    language: str,
+    config: ConfigLike,
+    max_workers: Optional[int] = None,
+    backend: Backend = "auto",
+    hot_reload: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Analyzes a batch of texts on the shared pool, in input order.
+
+    Args:
+        texts: Texts to analyze
+        language: Language code
+        config: System configuration
+        max_workers: Number of workers, defaults to the CPU count
+        backend: "thread", "process" or "auto"
+        hot_reload: Whether to pick up dictionary edits while running
+
+    Yields:
+        Dictionary with analysis results for each text
+    """
+    pool = get_pool(config, max_workers, backend, hot_reload)
+    yield from pool.imap(texts, language)
+
+
+def shutdown_pools(wait: bool = True) -> None:
+    """
+    Shuts down all shared pools.
+
+    Args:
+        wait: Whether to wait for running work to finish
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Fixtures shared by the test modules.
+"""
+
+import pytest
+
+from claim_checker.config import load_settings
+from claim_checker.workers import shutdown_pools
+
+# Short Ukrainian texts covering fallacies, hedges, evidence and emotion
+SAMPLE_TEXTS = (
+    "Всі люди або люблять шоколад, або ненавидять його.",
+    "Опонент не розуміє основ економіки, тому його аргументи безглузді.",
+    "Можливо, ця ідея має певні переваги, але здається, що вона радикальна.",
+    "Згідно з дослідженням, рівень безробіття знизився.",
+    "Це абсолютно жахливе і катастрофічне рішення!",
+)
+
+
+@pytest.fixture(scope="module")
+def settings():
+    """Default settings; shuts down the shared worker pools after the module."""
+    yield load_settings()
+    shutdown_pools()
+
+
+@pytest.fixture
+def texts():
+    """Sample texts to analyze."""
+    return list(SAMPLE_TEXTS)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the asyncio analysis API.
+"""
+
+import asyncio
+import threading
+
+from claim_checker import aio
+from claim_checker.aio import AsyncAnalyzer, analyze_text_async, analyze_texts_async
+from claim_checker.config import load_config, resolve_settings
+from claim_checker.core import analyze_text
+from claim_checker.workers import get_pool, shutdown_pools
+
+
+def test_analyze_text_async_matches_sync(settings, texts):
+    """Test that the async API returns the same report as analyze_text."""
+    report = asyncio.run(analyze_text_async(texts[0], "uk", settings, 2))
+    assert report == analyze_text(texts[0], "uk", settings)
+
+
+def test_batch_preserves_order(settings, texts):
+    """Test that batch results come back in input order."""
+
+    async def collect():
+        return [r async for r in analyze_texts_async(texts * 3, "uk", settings, 2)]
+
+    reports = asyncio.run(collect())
+    expected = [analyze_text(text, "uk", settings) for text in texts * 3]
+    assert reports == expected
+
+
+def test_batch_applies_backpressure(settings, texts):
+    """Test that the source is read at most max_concurrency texts ahead."""
+    pulled = 0
+
+    async def source():
+        nonlocal pulled
+        for text in texts * 4:
+            pulled += 1
+            yield text
+
+    async def consume():
+        analyzer = AsyncAnalyzer(settings, 2, get_pool(settings, 2))
+        consumed = 0
+        async for _ in analyzer.analyze_texts(source()):
+            consumed += 1
+            assert pulled <= consumed + 2
+        return consumed
+
+    assert asyncio.run(consume()) == len(texts) * 4
+
+
+def test_cancellation_releases_slots(settings, texts):
+    """Test that cancelled analyses do not leak concurrency slots."""
+
+    async def run():
+        analyzer = AsyncAnalyzer(settings, 1, get_pool(settings, 2))
+        tasks = [asyncio.ensure_future(analyzer.analyze_text(t)) for t in texts]
+        await asyncio.sleep(0)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return await asyncio.wait_for(analyzer.analyze_text(texts[1]), 60)
+
+    assert asyncio.run(run()) == analyze_text(texts[1], "uk", settings)
+
+
+def test_dict_config_is_resolved_once_off_the_loop(settings, texts, monkeypatch):
+    """Test that repeated calls with a dictionary do not validate on the loop."""
+    threads = []
+
+    def recording_resolve(config):
+        if isinstance(config, dict):
+            threads.append(threading.current_thread())
+        return resolve_settings(config)
+
+    monkeypatch.setattr(aio, "resolve_settings", recording_resolve)
+
+    async def run():
+        config = load_config()
+        return [await analyze_text_async(text, "uk", config) for text in texts]
+
+    reports = asyncio.run(run())
+    assert reports == [analyze_text(text, "uk", settings) for text in texts]
+    assert len(threads) == 1
+    assert threads[0] is not threading.main_thread()
+
+
+def test_default_analyzer_survives_pool_shutdown(settings, texts):
+    """Test that the helpers use a new shared pool after shutdown_pools."""
+
+    async def run():
+        first = await analyze_text_async(texts[0], "uk", settings)
+        shutdown_pools()
+        return first, await analyze_text_async(texts[0], "uk", settings)
+
+    first, second = asyncio.run(run())
+    assert first == second == analyze_text(texts[0], "uk", settings)
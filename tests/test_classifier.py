@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for the unsupported-claim classifier.
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+import yaml
+
+from claim_checker.config import (
+    get_config_dir,
+    load_config,
+    load_settings,
+    resolve_settings,
+)
+from claim_checker.core import AnalysisComponents
+from claim_checker.detector.classifier import (
+    ClaimClassifier,
+    load_classifier,
+    read_labeled_file,
+    train_classifier,
+)
+from claim_checker.detector.detector import EnhancedDetector
+
+LABELED_PATH = (
+    Path(__file__).parent.parent / "data" / "test_corpus" / "claims_labeled.tsv"
+)
+
+CLAIM = "Всі політики завжди брешуть своїм виборцям"
+SUPPORTED = "Згідно з дослідженням університету, рівень безробіття знизився"
+
+
+@pytest.fixture(scope="module")
+def model_path(tmp_path_factory):
+    """Trains a model on the sample labeled file."""
+    path = tmp_path_factory.mktemp("models") / "claims.joblib"
+    stats = train_classifier(LABELED_PATH, path)
+    assert stats["sentences"] == 20
+    assert stats["positives"] == 10
+    return path
+
+
+def settings_with_model(model_path):
+    """Returns the default settings with the claim model enabled."""
+    config = load_settings().model_dump()
+    config["detector"]["claim_model"] = model_path
+    return config
+
+
+def test_read_labeled_file_rejects_bad_lines(tmp_path):
+    """Test that malformed lines are reported with their line number."""
+    path = tmp_path / "bad.tsv"
+    path.write_text("# comment\n1\tclaim\nclaim without label\n", "utf-8")
+    with pytest.raises(ValueError, match="bad.tsv:3"):
+        read_labeled_file(path)
+
+
+def test_training_requires_both_labels():
+    """Test that training data without negatives is rejected."""
+    with pytest.raises(ValueError):
+        ClaimClassifier.train(["a", "b"], [1, 1])
+
+
+def test_scores_batch_in_one_call(model_path):
+    """Test that a batch of sentences gets one probability per sentence."""
+    classifier = load_classifier(model_path)
+    scores = classifier.score([CLAIM, SUPPORTED, CLAIM])
+    assert scores.shape == (3,)
+    assert scores[0] > 0.5 > scores[1]
+    assert scores[0] == scores[2]
+    assert classifier.score([]).shape == (0,)
+
+
+def test_model_is_loaded_once_per_process(model_path):
+    """Test that every detector shares the same loaded model."""
+    config = settings_with_model(model_path)
+    first = EnhancedDetector("uk", config)
+    second = EnhancedDetector("uk", config)
+    assert first.classifier is not None
+    assert first.classifier is second.classifier
+
+
+def test_detector_uses_model_for_unsupported_claims(model_path):
+    """Test that the detector flags claims by model probability."""
+    detector = EnhancedDetector("uk", settings_with_model(model_path))
+    results = detector.detect(f"{CLAIM}. {SUPPORTED}.", {})
+
+    claims = results["unsupported_claims"]
+    assert [claim["sentence"] for claim in claims] == [CLAIM]
+    assert 0.5 <= claims[0]["confidence"] <= 1
+    assert claims[0]["absolute_indicators"] == ["всі", "завжди"]
+
+
+def test_batch_matches_single_analysis(model_path):
+    """Test that batch analysis gives the same reports as one text at a time."""
+    components = AnalysisComponents("uk", settings_with_model(model_path))
+    texts = [f"{CLAIM}.", f"{SUPPORTED}.", ""]
+    assert components.analyze_batch(texts) == [
+        components.analyze(text) for text in texts
+    ]
+
+
+def test_relative_model_path_uses_config_dir(model_path, tmp_path, monkeypatch):
+    """Test that a relative claim_model is found in the config directory."""
+    config_dir = tmp_path / "config"
+    shutil.copytree(get_config_dir(), config_dir)
+    shutil.copy(model_path, config_dir / "claims.joblib")
+    config_path = config_dir / "config.yaml"
+    config = yaml.safe_load(config_path.read_text("utf-8"))
+    config.setdefault("detector", {})["claim_model"] = "claims.joblib"
+    config_path.write_text(yaml.safe_dump(config, allow_unicode=True), "utf-8")
+
+    monkeypatch.chdir(tmp_path)
+    settings = load_settings(config_dir)
+    assert settings.detector.claim_model == config_dir.resolve() / "claims.joblib"
+
+    # Dictionaries use the same rule as config.yaml
+    monkeypatch.setenv("CLAIM_CHECKER_CONFIG_DIR", str(config_dir))
+    resolved = resolve_settings(load_config())
+    assert resolved.detector.claim_model == settings.detector.claim_model
+    relative = resolve_settings({"detector": {"claim_model": "claims.joblib"}})
+    assert relative.detector.claim_model == settings.detector.claim_model
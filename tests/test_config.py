@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the configuration module.
+"""
+
+import shutil
+
+import pytest
+from pydantic import ValidationError
+
+from claim_checker.config import (
+    get_config_dir,
+    load_config,
+    load_settings,
+    resolve_settings,
+)
+from claim_checker.detector.detector import EnhancedDetector
+
+
+def test_settings_merge_config_language_and_rules():
+    """Test that the snapshot combines all configuration sources."""
+    settings = load_settings()
+    assert settings.language is not None
+    assert settings.language.code == "uk"
+    assert settings.severity("ad_hominem") == "high"
+    assert settings.severity("unknown_fallacy") == settings.detector.default_severity
+    assert load_settings() is settings
+
+
+def test_settings_are_immutable():
+    """Test that the snapshot cannot be modified."""
+    settings = load_settings()
+    with pytest.raises(ValidationError):
+        settings.default_language = "en"
+    with pytest.raises(TypeError):
+        settings.severity_map["ad_hominem"] = "low"
+
+
+def test_fingerprint_tracks_content(tmp_path):
+    """Test that the fingerprint is stable and changes with the configuration."""
+    same_dir = tmp_path / "same"
+    shutil.copytree(get_config_dir(), same_dir)
+    with open(same_dir / "config.yaml", "a", encoding="utf-8") as f:
+        f.write("\n# comments do not matter\n")
+    assert load_settings(same_dir).fingerprint == load_settings().fingerprint
+
+    changed_dir = tmp_path / "changed"
+    shutil.copytree(get_config_dir(), changed_dir)
+    rules = changed_dir / "rules" / "logical_fallacies.yaml"
+    rules.write_text(rules.read_text("utf-8").replace("high", "low"), "utf-8")
+    assert load_settings(changed_dir).fingerprint != load_settings().fingerprint
+
+
+def test_invalid_config_fails_fast(tmp_path):
+    """Test that invalid values are rejected when the settings are loaded."""
+    config_dir = tmp_path / "config"
+    shutil.copytree(get_config_dir(), config_dir)
+    with open(config_dir / "config.yaml", "a", encoding="utf-8") as f:
+        f.write("\ndetector:\n  emotion_threshold: 42\n")
+
+    with pytest.raises(ValueError, match="emotion_threshold"):
+        load_settings(config_dir)
+
+
+def test_detector_uses_configured_thresholds():
+    """Test that the detector reads thresholds from the settings."""
+    detector = EnhancedDetector("uk", {"detector": {"hedge_threshold": 1}})
+    assert detector.hedge_threshold == 1
+    assert resolve_settings({}).detector.hedge_threshold == 6
+
+
+def test_config_dict_gets_default_rules():
+    """Test that dictionary configurations keep the rule severities."""
+    detector = EnhancedDetector("uk", load_config())
+    assert detector._get_fallacy_severity("ad_hominem") == "high"
+    assert detector._get_fallacy_severity("straw_man") == "high"
+    assert EnhancedDetector("uk", {}).settings.severity("ad_hominem") == "high"
+    assert resolve_settings(load_config()).rules == load_settings().rules
+
+
+def test_invalid_config_dict_raises_value_error():
+    """Test that unknown keys in a dictionary are reported as ValueError."""
+    with pytest.raises(ValueError, match="unknown_section"):
+        EnhancedDetector("uk", {"unknown_section": {}})
+
+
+def test_config_dict_is_validated_once():
+    """Test that resolving an unchanged dictionary reuses the snapshot."""
+    config = load_config()
+    settings = resolve_settings(config)
+    assert resolve_settings(load_config()) is settings
+
+    config["detector"] = {"hedge_threshold": 2}
+    changed = resolve_settings(config)
+    assert changed is not settings
+    assert changed.detector.hedge_threshold == 2
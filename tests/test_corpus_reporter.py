@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the corpus reporter module.
+"""
+
+import numpy as np
+
+from claim_checker.reporter.corpus import (
+    CorpusReporter,
+    CorpusSummary,
+    merge_summaries,
+)
+from claim_checker.reporter.reporter import Reporter
+
+
+def _results(fallacies=(), unsupported=0, emotional=0, hedges=0):
+    return {
+        "logical_fallacies": [{"type": name} for name in fallacies],
+        "unsupported_claims": [{}] * unsupported,
+        "emotional_language": [{}] * emotional,
+        "hedges": [{}] * hedges,
+    }
+
+
+def test_scores_match_single_document_reporter():
+    """Test vectorized scores agree with Reporter.generate_report."""
+    documents = [
+        _results(),
+        _results(fallacies=["ad_hominem"] * 3, unsupported=2, emotional=4),
+        _results(fallacies=["straw_man"] * 30),
+        _results(hedges=5),
+    ]
+    corpus = CorpusReporter({})
+    reporter = Reporter("uk", {})
+    for results in documents:
+        corpus.add(results)
+
+    expected = [
+        reporter.generate_report(r)["summary"]["overall_score"] for r in documents
+    ]
+    assert corpus.scores().tolist() == expected
+
+
+def test_grouping_and_fallacy_rates():
+    """Test per-source and per-day aggregation."""
+    corpus = CorpusReporter({}, initial_capacity=1)
+    corpus.add(_results(fallacies=["ad_hominem", "ad_hominem"]), "a", "2025-01-01")
+    corpus.add(_results(), "a", "2025-01-02")
+    corpus.add(_results(fallacies=["straw_man"]), "b", "2025-01-01")
+    assert len(corpus) == 3
+
+    report = corpus.generate_report()
+    assert report["overall"]["documents"] == 3
+    assert report["by_source"]["a"]["documents"] == 2
+    assert report["by_day"]["2025-01-01"]["documents"] == 2
+
+    rates = report["by_source"]["a"]["fallacy_rates"]["ad_hominem"]
+    assert rates["per_document"] == 1.0
+    assert rates["document_share"] == 0.5
+    assert report["overall"]["score_percentiles"]["p50"] == 95
+
+
+def test_summaries_merge_like_a_single_run():
+    """Test that merged shard summaries equal a single pass over all documents."""
+    documents = [_results(fallacies=["ad_hominem"] * (i % 4)) for i in range(20)]
+
+    single = CorpusReporter({})
+    shards = [CorpusReporter({}), CorpusReporter({})]
+    for i, results in enumerate(documents):
+        single.add(results, "src")
+        shards[i % 2].add(results, "src")
+
+    restored = [
+        {key: CorpusSummary.from_dict(s.to_dict()) for key, s in r.summarize().items()}
+        for r in shards
+    ]
+    merged = merge_summaries(restored)
+    expected = single.summarize()
+
+    assert merged.keys() == expected.keys()
+    for key, summary in merged.items():
+        assert summary.documents == expected[key].documents
+        assert np.array_equal(summary.score_histogram, expected[key].score_histogram)
+        assert summary.fallacy_counts == expected[key].fallacy_counts
+    assert single.generate_report(merged) == single.generate_report()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Import-time budgets for the command-line entry points.
+
+Each scenario runs in a fresh interpreter and is timed from the first
+claim_checker import, so interpreter startup is not counted.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Budgets in seconds; scale with CLAIM_CHECKER_IMPORT_BUDGET_SCALE on slow hosts
+BUDGET_SCALE = float(os.environ.get("CLAIM_CHECKER_IMPORT_BUDGET_SCALE", "1"))
+HELP_BUDGET = 1.0
+ANALYSIS_BUDGET = 2.0
+
+# Packages that must only be imported by the features that need them
+HEAVY_MODULES = ("spacy", "sklearn", "matplotlib", "numpy", "nltk", "networkx")
+
+SCENARIO = """
+import json, sys, time
+start = time.perf_counter()
+from claim_checker.cli import app
+try:
+    app({args!r})
+except SystemExit:
+    pass
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+sys.stderr.write(json.dumps({{"seconds": elapsed, "heavy": heavy}}) + "\\n")
+"""
+
+
+def _measure(args):
+    code = SCENARIO.format(args=args, heavy=HEAVY_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "args, budget",
+    [
+        (["--help"], HELP_BUDGET),
+        (["analyze", "--text", "Всі люди завжди брешуть."], ANALYSIS_BUDGET),
+    ],
+    ids=["help", "single-text"],
+)
+def test_cli_import_budget(args, budget):
+    """Test that the CLI stays within its import-time budget."""
+    measured = _measure(args)
+    assert measured["heavy"] == []
+    assert measured["seconds"] < budget * BUDGET_SCALE
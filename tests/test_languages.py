@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Tests for the language pack registry.
+"""
+
+import subprocess
+import sys
+
+from claim_checker.languages import available_languages, get_language_pack
+
+
+def test_bundled_pack_is_discovered():
+    """Test that the Ukrainian pack is found by the package scan."""
+    assert "uk" in available_languages()
+    assert get_language_pack("xx") is None
+
+
+def test_pack_compiles_resources_once():
+    """Test that a pack shares one compiled resource set per process."""
+    pack = get_language_pack("uk")
+    assert pack is not None
+    assert pack.compiled_resources() is pack.compiled_resources()
+    assert "ad_hominem" in pack.compiled_resources().resources["logical_patterns"]
+
+
+def test_discovery_does_not_import_packs():
+    """Test that listing languages leaves pack modules unimported."""
+    code = (
+        "import sys\n"
+        "from claim_checker.languages import available_languages\n"
+        "assert 'uk' in available_languages()\n"
+        "print('claim_checker.languages.uk' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for the memory benchmark.
+"""
+
+from claim_checker.benchmarks import memory
+
+
+def _budgets(budgets):
+    return {
+        "input_sizes": [500, 2000],
+        "dictionary_scales": [1, 2],
+        "top_sites": 2,
+        "budgets": budgets,
+    }
+
+
+def test_default_budgets_are_met():
+    """Test that the bundled budgets hold on a small matrix."""
+    results = memory.run_benchmark(budgets=_budgets(memory.load_budgets()["budgets"]))
+    assert len(results["cases"]) == 4
+    for case in results["cases"]:
+        assert set(case["stages"]) == {
+            "load",
+            "analyze",
+            "detect",
+            "logic_gates",
+            "report",
+        }
+    assert results["violations"] == []
+
+
+def test_peak_grows_with_input_and_dictionary_size():
+    """Test that measurements reflect input and dictionary size."""
+    results = memory.run_benchmark(budgets=_budgets({}))
+    cases = {(c["text_size"], c["dictionary_scale"]): c for c in results["cases"]}
+    detect = {key: case["stages"]["detect"]["peak_kib"] for key, case in cases.items()}
+    load = {key: case["stages"]["load"]["retained_kib"] for key, case in cases.items()}
+    assert detect[(2000, 1)] > detect[(500, 1)]
+    assert load[(500, 2)] > load[(500, 1)]
+    assert cases[(500, 2)]["stages"]["detect"]["top_sites"]
+
+
+def test_exceeded_budget_fails_the_run(tmp_path):
+    """Test that a budget violation is reported and sets the exit status."""
+    budgets_path = tmp_path / "memory.yaml"
+    budgets_path.write_text(
+        "input_sizes: [500]\n"
+        "dictionary_scales: [1]\n"
+        "budgets:\n"
+        "  detect:\n"
+        "    peak_kib: {base: 0.001}\n",
+        "utf-8",
+    )
+    assert memory.main(["--budgets", str(budgets_path)]) == 1
+
+    results = memory.run_benchmark(budgets=memory.load_budgets(budgets_path))
+    assert len(results["violations"]) == 1
+    assert results["violations"][0].startswith("detect peak_kib")
+
+
+def test_load_stage_does_not_depend_on_run_order():
+    """Test that repeated cases compile their patterns from scratch."""
+    results = memory.run_benchmark(
+        budgets={"input_sizes": [500, 500], "dictionary_scales": [1], "budgets": {}}
+    )
+    first, second = (case["stages"]["load"]["peak_kib"] for case in results["cases"])
+    assert second > 0.8 * first
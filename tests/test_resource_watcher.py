@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Tests for hot-reloading of language resources.
+"""
+
+import shutil
+
+from claim_checker.detector.detector import EnhancedDetector
+from claim_checker.languages.resources import ResourceWatcher
+from claim_checker.languages.uk.loader import UkrainianResourceLoader
+
+
+def _watcher(tmp_path):
+    dict_dir = tmp_path / "dictionaries"
+    shutil.copytree(UkrainianResourceLoader().dict_dir, dict_dir)
+    return ResourceWatcher(UkrainianResourceLoader(dict_dir)), dict_dir
+
+
+def test_unchanged_dictionaries_are_not_reloaded(tmp_path):
+    """Test that checking without changes keeps the same snapshot."""
+    watcher, _ = _watcher(tmp_path)
+    snapshot = watcher.current
+    assert watcher.check() is False
+    assert watcher.current is snapshot
+
+
+def test_changed_dictionary_is_swapped_in(tmp_path):
+    """Test that a dictionary edit yields a new version and leaves the old one."""
+    watcher, dict_dir = _watcher(tmp_path)
+    old = watcher.current
+    detector = EnhancedDetector("uk", {}, watcher)
+    text = "Це явно неймовірнеслово."
+
+    assert detector.detect(text, {})["hedges"] == []
+
+    with open(dict_dir / "hedges.txt", "a", encoding="utf-8") as f:
+        f.write("\nявно,9\n")
+    assert watcher.check() is True
+
+    assert watcher.current is not old
+    assert watcher.current.version != old.version
+    assert "явно" not in old.resources["hedges"]
+
+    result = detector.detect(text, {})
+    assert result["resource_version"] == watcher.current.version
+    assert [h["hedge"] for h in result["hedges"]] == ["явно"]
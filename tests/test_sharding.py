@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Tests for sharded corpus runs.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from claim_checker.config import load_settings
+from claim_checker.core import AnalysisComponents
+from claim_checker.sharding import (
+    CORPUS_REPORT_NAME,
+    REPORTS_NAME,
+    ShardError,
+    merge,
+    pending_shards,
+    plan,
+    run_shard,
+    shard_paths,
+)
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def corpus(tmp_path, texts):
+    """Writes a corpus with a JSONL file and text files in a subdirectory."""
+    corpus_dir = tmp_path / "corpus"
+    (corpus_dir / "blog").mkdir(parents=True)
+    with open(corpus_dir / "news.jsonl", "w", encoding="utf-8") as f:
+        for i, text in enumerate(texts):
+            record = {"id": f"n{i}", "text": text, "source": "news"}
+            record["day"] = f"2024-01-0{i % 2 + 1}"
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        f.write("\n")
+    for i, text in enumerate(texts[:3]):
+        (corpus_dir / "blog" / f"post{i}.txt").write_text(text, "utf-8")
+    return corpus_dir
+
+
+def cli(*args, cwd=ROOT):
+    """Runs the command-line interface in a separate process."""
+    return subprocess.run(
+        [sys.executable, "-m", "claim_checker.cli", *map(str, args)],
+        cwd=cwd,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_plan_splits_corpus(corpus, tmp_path):
+    """Test that every document is assigned to exactly one shard."""
+    manifest = plan(corpus, tmp_path / "run", 3, load_settings())
+    assert manifest["documents"] == 8
+    assert [shard["documents"] for shard in manifest["shards"]] == [3, 3, 2]
+    assert pending_shards(tmp_path / "run") == [
+        "shard-00000",
+        "shard-00001",
+        "shard-00002",
+    ]
+    with pytest.raises(ShardError):
+        plan(corpus, tmp_path / "run", 3, load_settings())
+
+
+def test_shards_in_separate_processes_match_single_run(corpus, tmp_path, texts):
+    """Test that shards run as processes merge into the unsharded result."""
+    run_dir = tmp_path / "run"
+    result = cli("plan", corpus, run_dir, "--shard-size", 3)
+    assert result.returncode == 0, result.stderr
+    shard_ids = result.stdout.split()[-3:]
+
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-m", "claim_checker.cli", "run-shard", run_dir, shard_id],
+            cwd=ROOT,
+        )
+        for shard_id in reversed(shard_ids)
+    ]
+    assert [process.wait() for process in processes] == [0, 0, 0]
+
+    result = cli("merge", run_dir)
+    assert result.returncode == 0, result.stderr
+
+    components = AnalysisComponents("uk", load_settings())
+    expected = [components.analyze(text) for text in texts[:3] + texts]
+    # Shard reports went through JSON, which turns tuples into lists
+    with open(run_dir / REPORTS_NAME, "r", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert [record["report"] for record in records] == json.loads(json.dumps(expected))
+    assert [record["source"] for record in records] == ["blog"] * 3 + ["news"] * 5
+
+    report = json.loads((run_dir / CORPUS_REPORT_NAME).read_text("utf-8"))
+    assert report["overall"]["documents"] == 8
+    assert set(report["by_source"]) == {"blog", "news"}
+    assert set(report["by_day"]) == {"2024-01-01", "2024-01-02", "unknown"}
+
+
+def test_shard_runs_from_another_directory(corpus, tmp_path):
+    """Test that a run planned with relative paths works from any directory."""
+    result = cli("plan", "corpus", "run", "--shard-size", 8, cwd=tmp_path)
+    assert result.returncode == 0, result.stderr
+
+    other = tmp_path / "other"
+    other.mkdir()
+    result = cli("run-shard", "../run", "shard-00000", cwd=other)
+    assert result.returncode == 0, result.stderr
+    assert merge(tmp_path / "run")["overall"]["documents"] == 8
+
+
+def test_failed_shards_are_retried_without_redoing_others(corpus, tmp_path):
+    """Test that only incomplete shards run again and the merge is stable."""
+    run_dir = tmp_path / "run"
+    config = load_settings()
+    plan(corpus, run_dir, 3, config)
+    for shard_id in ("shard-00000", "shard-00001", "shard-00002"):
+        run_shard(run_dir, shard_id, config)
+    first = merge(run_dir)
+    merged_reports = (run_dir / REPORTS_NAME).read_bytes()
+
+    # Simulate a shard that died before writing its summary
+    reports_path, summary_path = shard_paths(run_dir, "shard-00001")
+    summary_path.unlink()
+    reports_path.write_text("partial", "utf-8")
+    with pytest.raises(ShardError, match="shard-00001"):
+        merge(run_dir)
+
+    assert run_shard(run_dir, "shard-00000", config) is None
+    assert run_shard(run_dir, "shard-00001", config) is not None
+    assert pending_shards(run_dir) == []
+    assert merge(run_dir) == first
+    assert (run_dir / REPORTS_NAME).read_bytes() == merged_reports
+
+
+def test_merge_detects_modified_shard_output(corpus, tmp_path):
+    """Test that shard reports must match the summary written with them."""
+    run_dir = tmp_path / "run"
+    config = load_settings()
+    plan(corpus, run_dir, 8, config)
+    run_shard(run_dir, "shard-00000", config)
+    reports_path, _ = shard_paths(run_dir, "shard-00000")
+    reports_path.write_text("", "utf-8")
+    with pytest.raises(ShardError, match="do not match"):
+        merge(run_dir)
+
+
+@pytest.mark.parametrize(
+    "line, message",
+    [
+        ('"just a string"', "expected a JSON object"),
+        ("{not json", "invalid JSON"),
+        ('{"text": 42}', "'text' must be a string"),
+    ],
+)
+def test_malformed_records_are_rejected(tmp_path, line, message):
+    """Test that bad JSONL records fail the shard with their location."""
+    corpus = tmp_path / "corpus.jsonl"
+    first = '{"text": "Добре."}\n'
+    corpus.write_text(first + line + "\n", "utf-8")
+    run_dir = tmp_path / "run"
+    plan(corpus, run_dir, 10, load_settings())
+
+    with pytest.raises(
+        ShardError, match=f"corpus.jsonl:{len(first.encode())}: {message}"
+    ):
+        run_shard(run_dir, "shard-00000", load_settings())
+    result = cli("run-shard", run_dir, "shard-00000")
+    assert result.returncode == 1
+    assert message in result.stderr
+    assert "Traceback" not in result.stderr
+
+
+def test_null_source_and_day_are_defaulted(tmp_path):
+    """Test that missing or non-string groups do not break summaries."""
+    corpus = tmp_path / "corpus.jsonl"
+    corpus.write_text(
+        '{"text": "Добре.", "source": null, "day": null}\n'
+        '{"text": "Погано.", "source": 7, "day": 20240101}\n',
+        "utf-8",
+    )
+    run_dir = tmp_path / "run"
+    plan(corpus, run_dir, 10, load_settings())
+    run_shard(run_dir, "shard-00000", load_settings())
+    report = merge(run_dir)
+    assert set(report["by_source"]) == {"7", "default"}
+    assert set(report["by_day"]) == {"20240101", "unknown"}
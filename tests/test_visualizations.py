@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tests for on-demand report visualizations.
+"""
+
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from claim_checker.config import load_settings
+from claim_checker.core import analyze_text
+from claim_checker.reporter import visualizations
+from claim_checker.reporter.visualizations import (
+    CHART_KINDS,
+    Visualizer,
+    emotion_timeline,
+    fallacy_type_counts,
+    hedge_density,
+    report_hash,
+)
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+DETAILS = {
+    "logical_fallacies": [
+        {"type": "straw_man"},
+        {"type": "ad_hominem"},
+        {"type": "straw_man"},
+    ],
+    "emotional_language": [
+        {"position": 7, "intensity": 8, "polarity": "negative"},
+        {"position": 2, "intensity": 5, "polarity": "positive"},
+    ],
+    "hedges": [
+        {"hedge": "можливо", "position": (0, 7), "uncertainty": 6},
+        {"hedge": "мабуть", "position": (95, 101), "uncertainty": 7},
+    ],
+    "text_length": 100,
+}
+
+REPORT = {"summary": {"overall_score": 80}, "details": DETAILS}
+
+
+@pytest.fixture
+def counting_renderers(monkeypatch):
+    """Replaces the renderers with stubs recording where they ran."""
+    calls = []
+
+    def render(details):
+        calls.append(threading.current_thread().name)
+        return PNG_SIGNATURE
+
+    monkeypatch.setattr(
+        visualizations, "RENDERERS", {kind: render for kind in CHART_KINDS}
+    )
+    return calls
+
+
+def test_chart_data():
+    """Test the data each chart is drawn from."""
+    assert fallacy_type_counts(DETAILS) == {"ad_hominem": 1, "straw_man": 2}
+    assert emotion_timeline(DETAILS) == [(2, 5), (7, -8)]
+    density = hedge_density(DETAILS, bins=10)
+    assert density[0] == 6
+    assert density[9] == 7
+    assert sum(density) == 13
+
+
+def test_report_hash_ignores_visualizations():
+    """Test that the hash only depends on report content."""
+    same = dict(REPORT, visualizations={"charts": list(CHART_KINDS)})
+    assert report_hash(same) == report_hash(REPORT)
+    changed = dict(REPORT, summary={"overall_score": 81})
+    assert report_hash(changed) != report_hash(REPORT)
+
+
+def test_reports_do_not_import_matplotlib():
+    """Test that generating a report does not load the charting stack."""
+    code = (
+        "import sys\n"
+        "from claim_checker.config import load_settings\n"
+        "from claim_checker.core import analyze_text\n"
+        "report = analyze_text('Всі люди брешуть.', 'uk', load_settings())\n"
+        "assert report['visualizations']['charts']\n"
+        "assert 'matplotlib' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_renders_png_for_every_chart():
+    """Test that real charts are rendered as PNG images."""
+    report = analyze_text("Всі люди брешуть.", "uk", load_settings())
+    visualizer = Visualizer()
+    try:
+        images = visualizer.render_all(report)
+    finally:
+        visualizer.shutdown()
+    assert set(images) == set(CHART_KINDS)
+    assert all(image.startswith(PNG_SIGNATURE) for image in images.values())
+
+
+def test_renders_once_in_background(counting_renderers):
+    """Test that images are rendered off the caller's thread and cached."""
+    visualizer = Visualizer()
+    try:
+        first = visualizer.render(REPORT, "fallacy_types")
+        again = visualizer.render(dict(REPORT), "fallacy_types")
+    finally:
+        visualizer.shutdown()
+    assert first is again
+    assert len(counting_renderers) == 1
+    assert counting_renderers[0].startswith("claim-checker-render")
+
+
+def test_disk_cache_survives_visualizer(counting_renderers, tmp_path):
+    """Test that a new visualizer reuses images stored in the cache directory."""
+    for _ in range(2):
+        visualizer = Visualizer(tmp_path)
+        try:
+            assert visualizer.render(REPORT, "hedge_density") == PNG_SIGNATURE
+        finally:
+            visualizer.shutdown()
+    assert len(counting_renderers) == 1
+
+
+def test_failed_render_is_retried(monkeypatch):
+    """Test that a failing render is not cached."""
+    results = [RuntimeError("broken"), PNG_SIGNATURE]
+
+    def render(details):
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setitem(visualizations.RENDERERS, "emotion_timeline", render)
+    visualizer = Visualizer()
+    try:
+        with pytest.raises(RuntimeError):
+            visualizer.render(REPORT, "emotion_timeline")
+        assert visualizer.render(REPORT, "emotion_timeline") == PNG_SIGNATURE
+        with pytest.raises(ValueError):
+            visualizer.render(REPORT, "pie_chart")
+    finally:
+        visualizer.shutdown()
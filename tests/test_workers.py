@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for the worker pools.
+"""
+
+import shutil
+import sys
+
+import pytest
+
+from claim_checker import workers
+from claim_checker.core import analyze_text
+from claim_checker.languages import get_language_pack
+from claim_checker.languages.uk.loader import UkrainianResourceLoader
+from claim_checker.workers import (
+    AnalysisPool,
+    analyze_batch,
+    get_worker_components,
+    gil_enabled,
+    resolve_backend,
+)
+
+
+def test_thread_backend_matches_sync(settings, texts):
+    """Test that the thread backend produces the same reports in order."""
+    reports = list(analyze_batch(texts * 5, "uk", settings, 4, backend="thread"))
+    assert reports == [analyze_text(text, "uk", settings) for text in texts * 5]
+
+
+def test_thread_backend_shares_one_resource_copy(settings, texts):
+    """Test that all pool threads use the process-wide compiled resources."""
+    pool = AnalysisPool(settings, 2, backend="thread")
+    try:
+        list(pool.imap(texts, "uk", window=1))
+        pack = get_language_pack("uk")
+        assert pack is not None
+        detector = pool.components("uk").detector
+        assert detector.current_resources() is pack.compiled_resources()
+    finally:
+        pool.shutdown()
+
+
+def test_compiled_resources_are_read_only():
+    """Test that shared resources cannot be modified by a worker."""
+    pack = get_language_pack("uk")
+    assert pack is not None
+    resources = pack.compiled_resources().resources
+    with pytest.raises(TypeError):
+        resources["hedges"]["можливо"] = 1
+    with pytest.raises(AttributeError):
+        resources["logical_patterns"]["ad_hominem"].append("x")
+
+
+def test_auto_backend_follows_the_gil(monkeypatch):
+    """Test that auto picks processes with the GIL and threads without it."""
+    assert resolve_backend("auto") == ("process" if gil_enabled() else "thread")
+    for enabled, backend in ((True, "process"), (False, "thread")):
+        monkeypatch.setattr(
+            sys, "_is_gil_enabled", lambda enabled=enabled: enabled, raising=False
+        )
+        assert gil_enabled() is enabled
+        assert resolve_backend("auto") == backend
+    assert resolve_backend("process") == "process"
+    with pytest.raises(ValueError):
+        resolve_backend("fibers")
+
+
+@pytest.fixture
+def editable_uk(monkeypatch, tmp_path):
+    """Points the Ukrainian pack's loader at a writable copy of its dictionaries."""
+    dict_dir = tmp_path / "dictionaries"
+    shutil.copytree(UkrainianResourceLoader().dict_dir, dict_dir)
+    pack = get_language_pack("uk")
+    assert pack is not None
+    monkeypatch.setattr(
+        pack, "create_loader", lambda: UkrainianResourceLoader(dict_dir)
+    )
+    return dict_dir
+
+
+def test_thread_pool_hot_reloads_dictionaries(settings, editable_uk):
+    """Test that a running thread pool picks up dictionary edits."""
+    text = "Це явно неймовірнеслово."
+    pool = AnalysisPool(settings, 2, backend="thread", hot_reload=True)
+    try:
+        assert pool.submit(text, "uk").result()["details"]["hedges"] == []
+
+        with open(editable_uk / "hedges.txt", "a", encoding="utf-8") as f:
+            f.write("\nявно,9\n")
+        watcher = pool.components("uk").detector.watcher
+        assert watcher is not None
+        assert watcher.check() is True
+
+        hedges = pool.submit(text, "uk").result()["details"]["hedges"]
+        assert [hedge["hedge"] for hedge in hedges] == ["явно"]
+    finally:
+        pool.shutdown()
+    assert watcher._thread is None
+
+
+def test_process_worker_starts_its_own_watcher(settings, editable_uk, monkeypatch):
+    """Test that process workers watch the dictionaries when hot reload is on."""
+    # Restore the worker globals of this process afterwards
+    monkeypatch.setattr(workers, "_worker_config", None)
+    monkeypatch.setattr(workers, "_worker_hot_reload", False)
+    monkeypatch.setattr(workers, "_worker_components", {})
+
+    workers._init_worker(settings, hot_reload=True)
+    watcher = get_worker_components("uk").detector.watcher
+    assert watcher is not None
+    try:
+        assert watcher._thread is not None
+    finally:
+        watcher.stop()